@@ -5,18 +5,66 @@ Goal Collision Analysis, and Adversarial Defense Testing.
 """
 
 from __future__ import annotations
+import os
 import time
+import multiprocessing
 import math
 import json
-from itertools import combinations
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import combinations, repeat
+from pickle import PicklingError
+from typing import Iterator
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # numba is optional; forecasting falls back to plain NumPy
+    njit = None
 from .models import (
-    SCM, GoalPredicate, NodeType, ControlState, InevitabilityResult
+    SCM, GoalPredicate, ControlState, InevitabilityResult
 )
-from .solver_engine import CausalSolver
+from .solver_engine import CausalSolver, CachedSolver
 from .mcs_extractor import MCSExtractor
 from .theater_detector import TheaterDetector
 
 
+def _as_cached(solver: CausalSolver | CachedSolver) -> CachedSolver:
+    """Reuse a shared CachedSolver, or give a bare solver a private cache."""
+    return solver if isinstance(solver, CachedSolver) else CachedSolver(solver)
+
+
+# ─── Solver worker pool ───────────────────────────────────────────────────────
+# Z3 contexts cannot be shared between threads, so parallel solving uses
+# processes, each with its own CausalSolver rebuilt from the (picklable) SCM.
+# It is opt-in: worker solves bypass the caller's CachedSolver, and the API
+# runs these engines on its solver thread, where forking is unsafe. Workers
+# are therefore spawned, never forked.
+
+_worker_solver: CausalSolver | None = None
+
+
+def _init_solver_worker(scm: SCM, timeout_ms: int) -> None:
+    global _worker_solver
+    _worker_solver = CausalSolver(scm, timeout_ms=timeout_ms)
+
+
+def _solver_pool(scm: SCM, timeout_ms: int, max_workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_solver_worker,
+        initargs=(scm, timeout_ms),
+    )
+
+
+def _eval_combo_scores(combo_ids: list[str], goals: list[GoalPredicate]) -> list[float]:
+    interventions = {cid: True for cid in combo_ids}
+    return [_worker_solver.compute_inevitability(g, interventions).score for g in goals]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # §20 — MULTI-GOAL STRATEGIC OPTIMIZATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -28,8 +76,16 @@ class MultiGoalOptimizer:
     below a threshold.
     """
 
+    # A combo whose goals all score at or below this is already saturated;
+    # any superset can only cost more for the same reduction.
+    SATURATION_EPSILON = 1e-3
+    # Above this many candidate combos, exhaustive enumeration gives way to beam search
+    EXHAUSTIVE_COMBO_LIMIT = 500
+    # Smaller batches are scored in-process; worker start-up would dominate
+    PARALLEL_MIN_COMBOS = 32
+
     def __init__(self, solver: CausalSolver, scm: SCM):
-        self.solver = solver
+        self.solver = _as_cached(solver)
         self.scm = scm
 
     def compute_optimal_strategies(
@@ -37,24 +93,27 @@ class MultiGoalOptimizer:
         goals: list[GoalPredicate],
         budget_limit: float = float('inf'),
         max_strategies: int = 5,
+        beam_width: int = 8,
+        parallel: bool = False,
     ) -> list[dict]:
         """
         Find the top-N defense strategies ranked by cost-effectiveness.
         Each strategy is a set of controls to enable/fix.
+        With parallel=True, large batches of combos are scored in worker
+        processes when more than one CPU is available.
         """
-        # Get all inactive/partial controls
-        fixable_controls = []
-        for eq in self.scm.equations:
-            node = self._find_node(eq.target_variable)
-            if node and node.type == NodeType.CONTROL:
-                if node.control_state in (ControlState.INACTIVE, ControlState.PARTIAL):
-                    cost = node.annual_cost or 0
-                    fixable_controls.append({
-                        "id": node.id,
-                        "name": node.name,
-                        "cost": cost,
-                        "type": node.control_type or "unknown",
-                    })
+        # Get all inactive/partial controls. Controls are usually exogenous
+        # (no structural equation of their own), so scan the node metadata.
+        by_state = self.scm.controls_by_state
+        fixable_controls = [
+            {
+                "id": meta.id,
+                "name": meta.name,
+                "cost": meta.annual_cost or 0,
+                "type": meta.control_type or "unknown",
+            }
+            for meta in (*by_state.get(ControlState.INACTIVE, ()), *by_state.get(ControlState.PARTIAL, ()))
+        ]
 
         # Compute baseline inevitability for all goals
         baselines = {}
@@ -62,47 +121,31 @@ class MultiGoalOptimizer:
             result = self.solver.compute_inevitability(goal)
             baselines[goal.id] = result.score
 
-        # Enumerate combinations of controls (up to size 4 for tractability)
-        strategies = []
+        # Enumerate combinations of controls (up to size 4 for tractability).
+        # Small inventories are searched exhaustively; larger ones fall back
+        # to a greedy beam search over forward selections.
         max_combo_size = min(4, len(fixable_controls))
+        search_space = sum(math.comb(len(fixable_controls), k) for k in range(1, max_combo_size + 1))
+        with ExitStack() as stack:
+            executor = None
+            workers = os.cpu_count() or 1
+            if parallel and search_space >= self.PARALLEL_MIN_COMBOS and workers > 1:
+                executor = stack.enter_context(
+                    _solver_pool(self.scm, self.solver.timeout_ms, workers)
+                )
+
+            if search_space <= self.EXHAUSTIVE_COMBO_LIMIT:
+                strategies = self._exhaustive_search(
+                    fixable_controls, goals, baselines, budget_limit, max_combo_size, executor,
+                )
+            else:
+                strategies = self._beam_search(
+                    fixable_controls, goals, baselines, budget_limit, max_combo_size, beam_width,
+                    executor,
+                )
 
-        for size in range(1, max_combo_size + 1):
-            for combo in combinations(fixable_controls, size):
-                total_cost = sum(c["cost"] for c in combo)
-                if total_cost > budget_limit:
-                    continue
-
-                # Simulate enabling these controls
-                interventions = {c["id"]: True for c in combo}
-
-                total_reduction = 0
-                goal_impacts = []
-                for goal in goals:
-                    new_result = self.solver.compute_inevitability(goal, interventions)
-                    reduction = baselines[goal.id] - new_result.score
-                    total_reduction += max(0, reduction)
-                    goal_impacts.append({
-                        "goal_id": goal.id,
-                        "goal_name": goal.name,
-                        "before": round(baselines[goal.id], 3),
-                        "after": round(new_result.score, 3),
-                        "reduction": round(max(0, reduction), 3),
-                    })
-
-                # Calculate ROI
-                roi = (total_reduction / (total_cost / 100000)) if total_cost > 0 else total_reduction * 1000
-
-                strategies.append({
-                    "controls": [c["name"] for c in combo],
-                    "control_ids": [c["id"] for c in combo],
-                    "total_cost": total_cost,
-                    "total_reduction": round(total_reduction, 3),
-                    "roi_score": round(roi, 2),
-                    "goal_impacts": goal_impacts,
-                    "description": self._generate_strategy_description(combo, goal_impacts),
-                })
-
-        # Sort by ROI (best first)
+        # Drop dominated strategies, then sort by ROI (best first)
+        strategies = self._pareto_front(strategies)
         strategies.sort(key=lambda s: s["roi_score"], reverse=True)
 
         # Mark the best as recommended
@@ -112,14 +155,242 @@ class MultiGoalOptimizer:
 
         return strategies[:max_strategies]
 
-    def _find_node(self, node_id: str):
-        for eq in self.scm.equations:
-            if eq.target_variable == node_id:
+    def _exhaustive_search(
+        self,
+        fixable_controls: list[dict],
+        goals: list[GoalPredicate],
+        baselines: dict[str, float],
+        budget_limit: float,
+        max_combo_size: int,
+        executor: ProcessPoolExecutor | None = None,
+    ) -> list[dict]:
+        """Score every control combination up to max_combo_size."""
+        strategies = []
+        saturated: set[frozenset[str]] = set()
+
+        # Enumerate over controls in ascending cost order so over-budget
+        # branches can be cut as soon as they are reached
+        by_cost = sorted(range(len(fixable_controls)), key=lambda i: fixable_controls[i]["cost"])
+        costs = [fixable_controls[i]["cost"] for i in by_cost]
+
+        # Size-major order keeps every subset scored before its supersets,
+        # which the saturation check below relies on
+        for size in range(1, max_combo_size + 1):
+            batch = []
+            for picks in self._affordable_combos(costs, size, budget_limit):
+                combo = [fixable_controls[i] for i in sorted(by_cost[p] for p in picks)]
+
+                # Skip supersets of a combo that already neutralises every goal
+                if not self._has_saturated_subset([c["id"] for c in combo], saturated):
+                    batch.append(combo)
+
+            # Same-size combos never prune each other, so a size scores as one batch
+            for combo, (strategy, neutralised) in zip(
+                batch, self._score_batch(batch, goals, baselines, executor)
+            ):
+                if neutralised:
+                    saturated.add(frozenset(strategy["control_ids"]))
+                strategies.append(strategy)
+
+        return strategies
+
+    def _beam_search(
+        self,
+        fixable_controls: list[dict],
+        goals: list[GoalPredicate],
+        baselines: dict[str, float],
+        budget_limit: float,
+        max_combo_size: int,
+        beam_width: int,
+        executor: ProcessPoolExecutor | None = None,
+    ) -> list[dict]:
+        """Greedy forward selection keeping the best beam_width combos per step.
+
+        Each step extends every combo in the beam by one more control and keeps
+        the top combos by ROI. Every visited combo is returned as a strategy.
+        """
+        visited: dict[frozenset[str], dict] = {}
+        saturated: set[frozenset[str]] = set()
+        beam: list[tuple[frozenset[str], float]] = [(frozenset(), 0.0)]
+
+        for _ in range(max_combo_size):
+            pending: dict[frozenset[str], list[dict]] = {}
+            for state, cost in beam:
+                for ctrl in fixable_controls:
+                    if ctrl["id"] in state or cost + ctrl["cost"] > budget_limit:
+                        continue
+                    expanded = state | {ctrl["id"]}
+                    if expanded in visited or expanded in pending:
+                        continue
+                    if self._has_saturated_subset(list(expanded), saturated):
+                        continue
+
+                    # Keep the inventory order so strategies read consistently
+                    pending[expanded] = [c for c in fixable_controls if c["id"] in expanded]
+
+            # Every candidate in a step has the same size, so they score as one batch
+            candidates: dict[frozenset[str], dict] = {}
+            scored = self._score_batch(list(pending.values()), goals, baselines, executor)
+            for expanded, (strategy, neutralised) in zip(pending, scored):
+                if neutralised:
+                    saturated.add(expanded)
+                candidates[expanded] = strategy
+
+            if not candidates:
+                break
+            visited.update(candidates)
+
+            # Saturated combos are not worth extending further
+            ranked = sorted(
+                (item for item in candidates.items() if item[0] not in saturated),
+                key=lambda item: item[1]["roi_score"],
+                reverse=True,
+            )
+            beam = [(state, strategy["total_cost"]) for state, strategy in ranked[:beam_width]]
+            if not beam:
+                break
+
+        return list(visited.values())
+
+    def _score_combo(
+        self,
+        combo: list[dict] | tuple[dict, ...],
+        goals: list[GoalPredicate],
+        baselines: dict[str, float],
+    ) -> tuple[dict, bool]:
+        """Build the strategy dict for enabling a combo of controls.
+
+        Also reports whether the combo neutralises every goal.
+        """
+        # Simulate enabling these controls
+        interventions = {c["id"]: True for c in combo}
+        scores = [self.solver.compute_inevitability(g, interventions).score for g in goals]
+        return self._strategy_from_scores(combo, goals, baselines, scores)
+
+    def _score_batch(
+        self,
+        combos: list[list[dict]],
+        goals: list[GoalPredicate],
+        baselines: dict[str, float],
+        executor: ProcessPoolExecutor | None,
+    ) -> list[tuple[dict, bool]]:
+        """Score a batch of combos, fanning out to worker processes when worthwhile."""
+        if executor is not None and len(combos) >= self.PARALLEL_MIN_COMBOS:
+            try:
+                rows = list(executor.map(
+                    _eval_combo_scores,
+                    [[c["id"] for c in combo] for combo in combos],
+                    repeat(goals),
+                    chunksize=max(1, len(combos) // (4 * (os.cpu_count() or 1))),
+                ))
+                return [
+                    self._strategy_from_scores(combo, goals, baselines, scores)
+                    for combo, scores in zip(combos, rows)
+                ]
+            except (OSError, BrokenProcessPool, PicklingError):
                 pass
-        # Fallback: search through node_metadata
-        if hasattr(self.scm, 'node_metadata') and self.scm.node_metadata:
-            return self.scm.node_metadata.get(node_id)
-        return None
+        return [self._score_combo(combo, goals, baselines) for combo in combos]
+
+    def _strategy_from_scores(
+        self,
+        combo: list[dict] | tuple[dict, ...],
+        goals: list[GoalPredicate],
+        baselines: dict[str, float],
+        scores: list[float],
+    ) -> tuple[dict, bool]:
+        total_cost = sum(c["cost"] for c in combo)
+
+        n = len(goals)
+        before = np.fromiter((baselines[g.id] for g in goals), dtype=np.float64, count=n)
+        after = np.array(scores, dtype=np.float64)
+        reduction = np.maximum(before - after, 0)
+        all_neutralised = bool((after <= self.SATURATION_EPSILON).all())
+        total_reduction = sum(reduction.tolist())
+
+        # Round the whole table in one go rather than per field
+        goal_impacts = [
+            {
+                "goal_id": goal.id,
+                "goal_name": goal.name,
+                "before": b,
+                "after": a,
+                "reduction": r,
+            }
+            for goal, b, a, r in zip(
+                goals,
+                np.round(before, 3).tolist(),
+                np.round(after, 3).tolist(),
+                np.round(reduction, 3).tolist(),
+            )
+        ]
+
+        # Calculate ROI
+        roi = (total_reduction / (total_cost / 100000)) if total_cost > 0 else total_reduction * 1000
+
+        strategy = {
+            "controls": [c["name"] for c in combo],
+            "control_ids": [c["id"] for c in combo],
+            "total_cost": total_cost,
+            "total_reduction": round(total_reduction, 3),
+            "roi_score": round(roi, 2),
+            "goal_impacts": goal_impacts,
+            "description": self._generate_strategy_description(combo, goal_impacts),
+        }
+        return strategy, all_neutralised
+
+    @staticmethod
+    def _affordable_combos(costs: list[float], size: int, budget_limit: float) -> Iterator[list[int]]:
+        """Yield index combos of ``size`` whose total cost fits the budget.
+
+        ``costs`` must be sorted ascending: once adding control i overshoots
+        the budget, every later (pricier) control would too, so the rest of
+        that branch is skipped.
+        """
+        n = len(costs)
+
+        def extend(prefix: list[int], start: int, running: float) -> Iterator[list[int]]:
+            if len(prefix) == size:
+                yield prefix
+                return
+            for i in range(start, n - (size - len(prefix)) + 1):
+                total = running + costs[i]
+                if total > budget_limit:
+                    break
+                yield from extend(prefix + [i], i + 1, total)
+
+        yield from extend([], 0, 0)
+
+    @staticmethod
+    def _pareto_front(strategies: list[dict]) -> list[dict]:
+        """Keep strategies that no other strategy beats on both cost and reduction.
+
+        A strategy is dominated when another costs no more and reduces at
+        least as much, and is strictly better on one of the two.
+        """
+        if len(strategies) < 2:
+            return strategies
+
+        # Both axes oriented so that lower is better
+        points = np.array(
+            [(s["total_cost"], -s["total_reduction"]) for s in strategies], dtype=np.float64,
+        )
+        keep = np.ones(len(points), dtype=bool)
+        for i in range(len(points)):
+            if keep[i]:
+                dominated = (points >= points[i]).all(axis=1) & (points > points[i]).any(axis=1)
+                keep &= ~dominated
+
+        return [s for s, kept in zip(strategies, keep.tolist()) if kept]
+
+    @staticmethod
+    def _has_saturated_subset(combo_ids: list[str], saturated: set[frozenset[str]]) -> bool:
+        if not saturated:
+            return False
+        for size in range(1, len(combo_ids)):
+            for subset in combinations(combo_ids, size):
+                if frozenset(subset) in saturated:
+                    return True
+        return False
 
     def _generate_strategy_description(self, controls, impacts):
         names = [c["name"] for c in controls]
@@ -134,6 +405,11 @@ class MultiGoalOptimizer:
 # §27 — CERTIFICATION MODE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Posture score >= threshold earns the next grade up
+_GRADE_THRESHOLDS = (40, 60, 75, 90)
+_GRADES = ("F", "D", "C", "B", "A")
+
+
 class CertificationEngine:
     """
     Generates formal certification reports with proof artifacts.
@@ -151,53 +427,54 @@ class CertificationEngine:
         organization: str = "Unknown",
     ) -> dict:
         """Generate a formal certification report."""
-        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        # Read the clock once so the timestamp and certification ID agree
+        now = time.time()
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
 
         # Count controls by state
-        controls = self._get_controls()
-        active_controls = [c for c in controls if c.get("state") == "ACTIVE"]
-        inactive_controls = [c for c in controls if c.get("state") == "INACTIVE"]
-        partial_controls = [c for c in controls if c.get("state") == "PARTIAL"]
+        by_state = self.scm.controls_by_state
+        total_controls = sum(len(metas) for metas in by_state.values())
+        active_controls = by_state.get(ControlState.ACTIVE, [])
+        inactive_controls = by_state.get(ControlState.INACTIVE, [])
+        partial_controls = by_state.get(ControlState.PARTIAL, [])
+
+        # Unpack results once into parallel arrays, one entry per goal
+        n = min(len(goals), len(inevitability_results))
+        scores = np.fromiter((r.score for r in inevitability_results), dtype=np.float64, count=n)
+        is_inev = np.fromiter((r.is_inevitable for r in inevitability_results), dtype=bool, count=n)
+        path_lens = np.fromiter(
+            (len(r.witness_path or ()) for r in inevitability_results), dtype=np.int32, count=n,
+        )
 
         # Compute overall posture score
-        if inevitability_results:
-            avg_inev = sum(r.score for r in inevitability_results) / len(inevitability_results)
-        else:
-            avg_inev = 0
+        avg_inev = float(scores.mean()) if n else 0
 
         posture_score = max(0, min(100, int((1 - avg_inev) * 100)))
 
         # Determine grade
-        if posture_score >= 90:
-            grade = "A"
-        elif posture_score >= 75:
-            grade = "B"
-        elif posture_score >= 60:
-            grade = "C"
-        elif posture_score >= 40:
-            grade = "D"
-        else:
-            grade = "F"
+        grade = _GRADES[bisect_right(_GRADE_THRESHOLDS, posture_score)]
 
         # Build goal assessments
         goal_assessments = []
-        for goal, result in zip(goals, inevitability_results):
+        for goal, score, inevitable, path_len in zip(
+            goals, np.round(scores, 4).tolist(), is_inev.tolist(), path_lens.tolist()
+        ):
             goal_assessments.append({
                 "goal_id": goal.id,
                 "goal_name": goal.name,
-                "inevitability_score": round(result.score, 4),
-                "status": "INEVITABLE" if result.is_inevitable else "DEFENDED",
-                "verdict": "FAIL" if result.is_inevitable else "PASS",
-                "attack_path_length": len(result.witness_path) if result.witness_path else 0,
+                "inevitability_score": score,
+                "status": "INEVITABLE" if inevitable else "DEFENDED",
+                "verdict": "FAIL" if inevitable else "PASS",
+                "attack_path_length": path_len,
             })
 
         # Build findings
         findings = []
-        failing_goals = [g for g in goal_assessments if g["verdict"] == "FAIL"]
-        if failing_goals:
+        failing_count = int(is_inev.sum())
+        if failing_count:
             findings.append({
                 "severity": "CRITICAL",
-                "finding": f"{len(failing_goals)} of {len(goals)} attack goals are structurally inevitable",
+                "finding": f"{failing_count} of {len(goals)} attack goals are structurally inevitable",
                 "recommendation": "Address controls identified in MCS analysis immediately",
             })
         if inactive_controls:
@@ -212,7 +489,7 @@ class CertificationEngine:
                 "finding": f"{len(partial_controls)} security controls are only PARTIALLY effective",
                 "recommendation": "Review partial controls for configuration gaps",
             })
-        if not failing_goals:
+        if not failing_count:
             findings.append({
                 "severity": "INFO",
                 "finding": "All analyzed attack goals are structurally defended",
@@ -220,19 +497,19 @@ class CertificationEngine:
             })
 
         return {
-            "certification_id": f"INEV-CERT-{int(time.time())}",
+            "certification_id": f"INEV-CERT-{int(now)}",
             "timestamp": timestamp,
             "organization": organization,
             "engine_version": "1.0.0",
             "posture_score": posture_score,
             "grade": grade,
-            "total_controls": len(controls),
+            "total_controls": total_controls,
             "active_controls": len(active_controls),
             "inactive_controls": len(inactive_controls),
             "partial_controls": len(partial_controls),
             "goals_analyzed": len(goals),
-            "goals_defended": len(goals) - len(failing_goals),
-            "goals_inevitable": len(failing_goals),
+            "goals_defended": len(goals) - failing_count,
+            "goals_inevitable": failing_count,
             "goal_assessments": goal_assessments,
             "findings": findings,
             "scm_nodes": len(self.scm.equations),
@@ -240,25 +517,58 @@ class CertificationEngine:
             "formal_guarantee": "Results are provably correct under the modeled infrastructure topology",
         }
 
-    def _get_controls(self) -> list[dict]:
-        controls = []
-        if hasattr(self.scm, 'node_metadata') and self.scm.node_metadata:
-            for nid, meta in self.scm.node_metadata.items():
-                if hasattr(meta, 'type') and meta.type == NodeType.CONTROL:
-                    controls.append({
-                        "id": nid,
-                        "name": meta.name,
-                        "state": meta.control_state.value if meta.control_state else "UNKNOWN",
-                        "type": meta.control_type or "unknown",
-                        "cost": meta.annual_cost or 0,
-                    })
-        return controls
-
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # §29 — FAILURE FORECASTING
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_FORECAST_STATUSES = ("DEFENDED", "AT_RISK", "INEVITABLE")
+
+
+def _project_numpy(scores, thresholds, combined_drift, months_ahead):
+    """Project scores forward; returns (projected, rounded, crossing month or -1)."""
+    months = np.arange(months_ahead + 1)
+
+    # Model: score increases sigmoidally toward 1.0
+    # Faster growth when current score is in the middle range
+    decay = 1 - np.exp(-combined_drift * months)
+    projected = np.minimum(scores[:, None] + (1 - scores[:, None]) * decay[None, :], 1.0)
+    rounded = np.round(projected, 4)
+
+    # Find when threshold is crossed
+    crossed = rounded >= thresholds[:, None]
+    has_crossing = crossed.any(axis=1) & (scores < thresholds)
+    crossing = np.where(has_crossing, np.argmax(crossed, axis=1), -1)
+    return projected, rounded, crossing
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _project_compiled(scores, thresholds, combined_drift, months_ahead):
+        """Single-pass compiled equivalent of _project_numpy."""
+        n_goals = scores.shape[0]
+        projected = np.empty((n_goals, months_ahead + 1))
+        for g in range(n_goals):
+            s = scores[g]
+            for m in range(months_ahead + 1):
+                p = s + (1 - s) * (1 - math.exp(-combined_drift * m))
+                projected[g, m] = p if p < 1.0 else 1.0
+        rounded = np.round(projected, 4)
+
+        crossing = np.full(n_goals, -1, np.int64)
+        for g in range(n_goals):
+            if scores[g] < thresholds[g]:
+                for m in range(months_ahead + 1):
+                    if rounded[g, m] >= thresholds[g]:
+                        crossing[g] = m
+                        break
+        return projected, rounded, crossing
+
+    _project = _project_compiled
+else:
+    _project = _project_numpy
+
+
 class FailureForecaster:
     """
     Projects how inevitability scores will drift over time based on
@@ -291,29 +601,31 @@ class FailureForecaster:
         """
         rates = drift_rates or self.DEFAULT_DRIFT_RATES
         combined_drift = sum(rates.values()) / len(rates) if rates else 0.04
+        primary_driver = max(rates, key=rates.get) if rates else "unknown"
+
+        n = min(len(goals), len(inevitability_results))
+        scores = np.fromiter((r.score for r in inevitability_results), dtype=np.float64, count=n)
+        thresholds = np.fromiter((g.threshold for g in goals), dtype=np.float64, count=n)
+        months = range(months_ahead + 1)
+
+        projected, rounded, crossing = _project(scores, thresholds, float(combined_drift), months_ahead)
+        status_codes = np.where(
+            projected >= thresholds[:, None], 2, np.where(projected >= 0.5, 1, 0)
+        )
 
         goal_forecasts = []
-        for goal, result in zip(goals, inevitability_results):
-            current = result.score
-            projections = []
-
-            for month in range(0, months_ahead + 1):
-                # Model: score increases sigmoidally toward 1.0
-                # Faster growth when current score is in the middle range
-                projected = current + (1 - current) * (1 - math.exp(-combined_drift * month))
-                projected = min(1.0, projected)
-                projections.append({
+        for i, (goal, current) in enumerate(zip(goals, scores.tolist())):
+            projections = [
+                {
                     "month": month,
-                    "projected_score": round(projected, 4),
-                    "status": "INEVITABLE" if projected >= goal.threshold else "AT_RISK" if projected >= 0.5 else "DEFENDED",
-                })
-
-            # Find when threshold is crossed
-            crossing_month = None
-            for p in projections:
-                if p["projected_score"] >= goal.threshold and current < goal.threshold:
-                    crossing_month = p["month"]
-                    break
+                    "projected_score": score,
+                    "status": _FORECAST_STATUSES[code],
+                }
+                for month, score, code in zip(
+                    months, rounded[i].tolist(), status_codes[i].tolist()
+                )
+            ]
+            crossing_month = int(crossing[i]) if crossing[i] >= 0 else None
 
             goal_forecasts.append({
                 "goal_id": goal.id,
@@ -324,7 +636,7 @@ class FailureForecaster:
                 "crossing_month": crossing_month,
                 "months_to_inevitable": crossing_month,
                 "risk_trajectory": "ACCELERATING" if current > 0.3 else "STABLE" if current < 0.1 else "DRIFTING",
-                "primary_driver": max(rates, key=rates.get) if rates else "unknown",
+                "primary_driver": primary_driver,
             })
 
         # Overall assessment
@@ -363,27 +675,37 @@ class GoalCollisionAnalyzer:
     """
 
     def __init__(self, solver: CausalSolver, scm: SCM):
-        self.solver = solver
+        self.solver = _as_cached(solver)
         self.scm = scm
+        self._controls_cache: dict[str, frozenset[str]] = {}
 
     def analyze_collisions(self, goals: list[GoalPredicate]) -> list[dict]:
         """Analyze pairwise interactions between goals."""
         if len(goals) < 2:
             return []
 
+        # Baselines are shared by every pair a goal takes part in
+        baselines = {
+            goal.id: self.solver.compute_inevitability(goal)
+            for goal in goals
+        }
+
         collisions = []
         for i, g1 in enumerate(goals):
             for g2 in goals[i + 1:]:
-                collision = self._analyze_pair(g1, g2)
+                collision = self._analyze_pair(g1, g2, baselines[g1.id], baselines[g2.id])
                 collisions.append(collision)
 
         return collisions
 
-    def _analyze_pair(self, g1: GoalPredicate, g2: GoalPredicate) -> dict:
-        """Analyze the interaction between two goals."""
-        # Baseline scores
-        r1 = self.solver.compute_inevitability(g1)
-        r2 = self.solver.compute_inevitability(g2)
+    def _analyze_pair(
+        self,
+        g1: GoalPredicate,
+        g2: GoalPredicate,
+        r1: InevitabilityResult,
+        r2: InevitabilityResult,
+    ) -> dict:
+        """Analyze the interaction between two goals given their baseline results."""
 
         # Find shared controls (controls that appear in attack paths of both goals)
         controls_g1 = self._get_relevant_controls(g1)
@@ -427,50 +749,157 @@ class GoalCollisionAnalyzer:
             "unique_to_goal_2": len(unique_g2),
         }
 
-    def _get_relevant_controls(self, goal: GoalPredicate) -> set[str]:
-        """Get all control IDs that are structurally relevant to a goal."""
+    def _get_relevant_controls(self, goal: GoalPredicate) -> frozenset[str]:
+        """Get all control IDs that are structurally relevant to a goal.
+
+        Walks backward from the goal's target assets through the structural
+        equations, collecting every negated (control) parent on the way.
+        Memoized per goal, since each goal takes part in several pairs.
+        """
+        cached = self._controls_cache.get(goal.id)
+        if cached is not None:
+            return cached
+
         controls = set()
-        target_ids = set(goal.target_assets)
+        seen = set(goal.target_assets)
+        queue = deque(goal.target_assets)
 
-        # Walk backward from target to find all relevant controls
-        for eq in self.scm.equations:
-            if eq.target_variable in target_ids:
-                for parent in (eq.negated_parents or []):
-                    controls.add(parent)
-                # Recursively add parents
-                for parent in (eq.parent_variables or []):
-                    target_ids.add(parent)
+        while queue:
+            eq = self.scm.equations_by_target.get(queue.popleft())
+            if eq is None:
+                continue
+            controls.update(eq.negated_parents)
+            for parent in eq.parent_variables:
+                if parent not in seen:
+                    seen.add(parent)
+                    queue.append(parent)
 
-        return controls
+        result = frozenset(controls)
+        self._controls_cache[goal.id] = result
+        return result
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # §32 — ADVERSARIAL DEFENSE TESTING
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Impact strictly above a threshold earns the next severity up
+_SEVERITY_THRESHOLDS = (0.05, 0.2, 0.5)
+_SEVERITIES = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+
+def _influence_cone(scm: SCM, roots: list[str]) -> set[str]:
+    """Every variable whose value can affect any of ``roots`` (roots included).
+
+    Walks both enabling and blocking parents, so a control outside the cone
+    provably cannot change a goal's satisfiability.
+    """
+    cone = set(roots)
+    queue = deque(roots)
+
+    while queue:
+        eq = scm.equations_by_target.get(queue.popleft())
+        if eq is None:
+            continue
+        for parent in (*eq.parent_variables, *eq.negated_parents):
+            if parent not in cone:
+                cone.add(parent)
+                queue.append(parent)
+
+    return cone
+
+
+def _unreachable_ctrl_failure(ctrl: dict, goals: list[GoalPredicate], baselines: dict[str, float]) -> dict:
+    """Zero-impact record for a control with no structural path to any goal."""
+    return {
+        "control_to_bypass": ctrl["name"],
+        "control_id": ctrl["id"],
+        "bypass_cost_estimate": ctrl["cost"],
+        "max_impact": 0,
+        "goal_impacts": [
+            {
+                "goal": goal.name,
+                "before": round(baselines[goal.id], 3),
+                "after": round(baselines[goal.id], 3),
+                "delta": 0.0,
+            }
+            for goal in goals
+        ],
+        "severity": "LOW",
+    }
+
+
+def _score_ctrl_failure(
+    solver: CausalSolver,
+    ctrl: dict,
+    goals: list[GoalPredicate],
+    baselines: dict[str, float],
+) -> dict:
+    """Measure how much bypassing a single control raises each goal's score."""
+    interventions = {ctrl["id"]: False}
+    n = len(goals)
+    before = np.fromiter((baselines[g.id] for g in goals), dtype=np.float64, count=n)
+    after = np.fromiter(
+        (solver.compute_inevitability(g, interventions).score for g in goals),
+        dtype=np.float64, count=n,
+    )
+    delta = after - before
+    max_impact = max(0, *delta.tolist()) if n else 0
+
+    # Round the whole table in one go rather than per field
+    impacts = [
+        {"goal": goal.name, "before": b, "after": a, "delta": d}
+        for goal, b, a, d in zip(
+            goals,
+            np.round(before, 3).tolist(),
+            np.round(after, 3).tolist(),
+            np.round(delta, 3).tolist(),
+        )
+    ]
+
+    return {
+        "control_to_bypass": ctrl["name"],
+        "control_id": ctrl["id"],
+        "bypass_cost_estimate": ctrl["cost"],
+        "max_impact": round(max_impact, 3),
+        "goal_impacts": impacts,
+        "severity": _SEVERITIES[bisect_left(_SEVERITY_THRESHOLDS, max_impact)],
+    }
+
+
+def _eval_ctrl_failure(ctrl: dict, goals: list[GoalPredicate], baselines: dict[str, float]) -> dict:
+    return _score_ctrl_failure(_worker_solver, ctrl, goals, baselines)
+
+
 class AdversarialTester:
     """
     Red team simulation: finds the optimal attack strategy given current defenses.
     Identifies which single control failure would be most devastating.
     """
 
+    # Below this many controls, worker start-up costs more than it saves
+    PARALLEL_MIN_CONTROLS = 8
+
     def __init__(self, solver: CausalSolver, scm: SCM):
         self.solver = solver
         self.scm = scm
 
-    def run_adversarial_test(self, goals: list[GoalPredicate]) -> dict:
-        """Simulate an optimal adversary and find the weakest links."""
+    def run_adversarial_test(self, goals: list[GoalPredicate], parallel: bool = False) -> dict:
+        """Simulate an optimal adversary and find the weakest links.
+
+        Each control bypass is an independent set of solves; with
+        parallel=True, large control inventories are fanned out across worker
+        processes when more than one CPU is available.
+        """
         # Get all active controls
-        active_controls = []
-        if hasattr(self.scm, 'node_metadata') and self.scm.node_metadata:
-            for nid, meta in self.scm.node_metadata.items():
-                if hasattr(meta, 'type') and meta.type == NodeType.CONTROL:
-                    if meta.control_state == ControlState.ACTIVE:
-                        active_controls.append({
-                            "id": nid,
-                            "name": meta.name,
-                            "cost": meta.annual_cost or 0,
-                        })
+        active_controls = [
+            {
+                "id": meta.id,
+                "name": meta.name,
+                "cost": meta.annual_cost or 0,
+            }
+            for meta in self.scm.controls_by_state.get(ControlState.ACTIVE, ())
+        ]
 
         # Baseline
         baselines = {}
@@ -478,49 +907,69 @@ class AdversarialTester:
             r = self.solver.compute_inevitability(goal)
             baselines[goal.id] = r.score
 
+        # Controls outside every goal's influence cone cannot move a score,
+        # so only the reachable ones need solving
+        reachable = _influence_cone(
+            self.scm,
+            [v for g in goals for v in (*g.target_assets, *g.required_conditions)],
+        )
+        to_solve = [c for c in active_controls if c["id"] in reachable]
+
         # Test each control failure
-        attack_vectors = []
-        for ctrl in active_controls:
-            interventions = {ctrl["id"]: False}
-            max_impact = 0
-            impacts = []
-
-            for goal in goals:
-                new_r = self.solver.compute_inevitability(goal, interventions)
-                impact = new_r.score - baselines[goal.id]
-                max_impact = max(max_impact, impact)
-                impacts.append({
-                    "goal": goal.name,
-                    "before": round(baselines[goal.id], 3),
-                    "after": round(new_r.score, 3),
-                    "delta": round(impact, 3),
-                })
-
-            attack_vectors.append({
-                "control_to_bypass": ctrl["name"],
-                "control_id": ctrl["id"],
-                "bypass_cost_estimate": ctrl["cost"],
-                "max_impact": round(max_impact, 3),
-                "goal_impacts": impacts,
-                "severity": "CRITICAL" if max_impact > 0.5 else "HIGH" if max_impact > 0.2 else "MEDIUM" if max_impact > 0.05 else "LOW",
-            })
+        if parallel and len(to_solve) >= self.PARALLEL_MIN_CONTROLS and (os.cpu_count() or 1) > 1:
+            solved = self._evaluate_in_pool(to_solve, goals, baselines)
+        else:
+            solved = [
+                _score_ctrl_failure(self.solver, ctrl, goals, baselines)
+                for ctrl in to_solve
+            ]
+
+        solved_by_id = {v["control_id"]: v for v in solved}
+        attack_vectors = [
+            solved_by_id.get(ctrl["id"]) or _unreachable_ctrl_failure(ctrl, goals, baselines)
+            for ctrl in active_controls
+        ]
 
         # Sort by impact (most devastating first)
         attack_vectors.sort(key=lambda v: v["max_impact"], reverse=True)
 
+        severity_counts = Counter(v["severity"] for v in attack_vectors)
+
         return {
             "total_controls_tested": len(active_controls),
-            "critical_vectors": len([v for v in attack_vectors if v["severity"] == "CRITICAL"]),
-            "high_vectors": len([v for v in attack_vectors if v["severity"] == "HIGH"]),
+            "critical_vectors": severity_counts["CRITICAL"],
+            "high_vectors": severity_counts["HIGH"],
             "attack_vectors": attack_vectors,
             "optimal_attack": attack_vectors[0] if attack_vectors else None,
-            "recommendation": self._summarize(attack_vectors),
+            "recommendation": self._summarize(attack_vectors, severity_counts["CRITICAL"]),
         }
 
-    def _summarize(self, vectors):
+    def _evaluate_in_pool(
+        self,
+        active_controls: list[dict],
+        goals: list[GoalPredicate],
+        baselines: dict[str, float],
+    ) -> list[dict]:
+        """Score control failures across worker processes.
+
+        Falls back to serial evaluation if the pool cannot be used.
+        """
+        workers = min(os.cpu_count() or 1, len(active_controls))
+        try:
+            with _solver_pool(self.scm, self.solver.timeout_ms, workers) as executor:
+                return list(executor.map(
+                    _eval_ctrl_failure, active_controls, repeat(goals), repeat(baselines),
+                ))
+        except (OSError, BrokenProcessPool, PicklingError):
+            return [
+                _score_ctrl_failure(self.solver, ctrl, goals, baselines)
+                for ctrl in active_controls
+            ]
+
+    def _summarize(self, vectors, critical_count):
         if not vectors:
             return "No active controls to test."
-        critical = [v for v in vectors if v["severity"] == "CRITICAL"]
-        if critical:
-            return f"ALERT: {len(critical)} critical single-point-of-failure controls identified. Bypassing '{critical[0]['control_to_bypass']}' causes maximum damage."
+        if critical_count:
+            # Vectors are sorted by impact, so the first one is the worst critical
+            return f"ALERT: {critical_count} critical single-point-of-failure controls identified. Bypassing '{vectors[0]['control_to_bypass']}' causes maximum damage."
         return "No critical single-point-of-failure controls found. Defense posture is reasonably resilient to individual control bypass."
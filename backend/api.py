@@ -4,21 +4,33 @@ API layer exposing the causal analysis engine to the frontend dashboard.
 """
 
 from __future__ import annotations
+import asyncio
+import multiprocessing
 import time
 import pathlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional
 
 from .models import (
     AnalysisResult, GoalPredicate, BreachCaseStudy,
     CausalGraph, InfraNode, InfraEdge, GoalTemplate, NodeType,
+    InevitabilityResult, MCSResult, TheaterReport, CollapseFrame,
+    ExplanationTree, ProofArtifact, CollapseMetrics, Assumption, SCM,
+    EconomicReport, FragilityProfile,
 )
 from .scm_builder import SCMBuilder
-from .solver_engine import CausalSolver
+from .solver_engine import CausalSolver, CachedSolver
 from .mcs_extractor import MCSExtractor
 from .theater_detector import TheaterDetector
 from .counterfactual import CounterfactualEngine
@@ -26,31 +38,163 @@ from .economic import EconomicAnalyzer
 from .collapse import CollapseEngine
 from .explainability import ExplainabilityEngine
 from .breach_data import load_scenario, get_all_scenarios
-from .advanced_features import (
-    MultiGoalOptimizer, CertificationEngine, FailureForecaster,
-    GoalCollisionAnalyzer, AdversarialTester,
-)
 from .probability_engine import ProbabilityEngine, ADVERSARY_PROFILES
 
 
 # ─── App Setup ────────────────────────────────────────────────────────────────
 
+class _ORJSONResponse(ORJSONResponse):
+    """orjson response that also accepts NumPy values and non-string dict keys."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def _orjson_default(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(payload) -> bytes:
+    """Serialize a payload that may still contain pydantic models in one orjson pass."""
+    return orjson.dumps(
+        payload,
+        default=_orjson_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def _json_response(payload) -> Response:
+    """Returning a ready-made Response skips FastAPI's jsonable_encoder walk."""
+    return _bytes_response(_dumps(payload))
+
+
+def _bytes_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
+# List adapters serialize a whole collection in one pydantic-core call
+_INEV_ADAPTER = TypeAdapter(list[InevitabilityResult])
+_MCS_ADAPTER = TypeAdapter(list[MCSResult])
+_THEATER_ADAPTER = TypeAdapter(list[TheaterReport])
+_FRAMES_ADAPTER = TypeAdapter(list[CollapseFrame])
+_EXPLANATIONS_ADAPTER = TypeAdapter(list[ExplanationTree])
+_PROOFS_ADAPTER = TypeAdapter(list[ProofArtifact])
+_RANKING_ADAPTER = TypeAdapter(list[CollapseMetrics])
+_NODES_ADAPTER = TypeAdapter(list[InfraNode])
+_EDGES_ADAPTER = TypeAdapter(list[InfraEdge])
+_ASSUMPTIONS_ADAPTER = TypeAdapter(list[Assumption])
+_GOALS_ADAPTER = TypeAdapter(list[GoalPredicate])
+
+# Single-model serializers, bound once rather than looked up per dump
+_SER_ECONOMIC = EconomicReport.__pydantic_serializer__.to_python
+_SER_FRAGILITY = FragilityProfile.__pydantic_serializer__.to_python
+_SER_CASE_STUDY = BreachCaseStudy.__pydantic_serializer__.to_python
+
+
+# Worker processes for the CPU-bound per-goal analyses (Z3 holds the GIL).
+# The pool lives for the app's lifespan; its workers are spawned, not forked,
+# since this process already runs the solver thread and the server's threads.
+_POOL: ProcessPoolExecutor | None = None
+
+
+def _new_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+def _replace_broken_pool(broken: ProcessPoolExecutor) -> None:
+    """Swap in a fresh pool once a dead worker has broken ``broken``.
+
+    Concurrent requests may all see the same breakage; only the first one
+    to get here replaces it.
+    """
+    global _POOL
+    if _POOL is broken:
+        _POOL = _new_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    global _POOL
+    _POOL = _new_pool()
+    try:
+        yield
+    finally:
+        pool, _POOL = _POOL, None
+        pool.shutdown(cancel_futures=True)
+
+
 app = FastAPI(
     title="INEVITABILITY",
     description="Structural Reverse-Engineered Causal Goal Decompiler for Cybersecurity",
     version="1.0.0",
+    default_response_class=_ORJSONResponse,
+    lifespan=_lifespan,
 )
 
+# The dashboard is served either by the mount below (:8000) or by
+# start.bat's static server (:3000); it sends no cookies or auth headers.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=[
+        "http://localhost:3000",
+        "http://127.0.0.1:3000",
+        "http://localhost:8000",
+        "http://127.0.0.1:8000",
+    ],
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
 )
 
+# Analysis payloads are large, repetitive JSON; small replies go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=2048)
+
+class _SessionStore:
+    """In-memory analysis sessions, capped in count and age.
+
+    Least-recently-used sessions are evicted past ``maxsize``, and a session
+    expires ``ttl_s`` seconds after it was stored.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl_s: float = 3600.0):
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._items: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def get(self, session_id: str) -> dict | None:
+        entry = self._items.get(session_id)
+        if entry is None:
+            return None
+        stored_at, session = entry
+        if time.monotonic() - stored_at > self._ttl_s:
+            del self._items[session_id]
+            return None
+        self._items.move_to_end(session_id)
+        return session
+
+    def __setitem__(self, session_id: str, session: dict):
+        self._items[session_id] = (time.monotonic(), session)
+        self._items.move_to_end(session_id)
+        while len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 # In-memory cache for active analysis sessions
-_active_sessions: dict[str, dict] = {}
+_active_sessions = _SessionStore()
+
+# Z3's default context is not thread-safe, so all solver work in this
+# process is funnelled through one dedicated thread, off the event loop
+_SOLVER_THREAD = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solver")
+
+
+async def _on_solver_thread(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(_SOLVER_THREAD, fn, *args)
 
 
 # ─── Request Models ──────────────────────────────────────────────────────────
@@ -99,15 +243,53 @@ async def health():
 
 # ─── Scenarios ────────────────────────────────────────────────────────────────
 
+# Scenarios are static, so the listing and case-study payloads are
+# serialised once per process.
+_SCENARIOS_BYTES = _dumps(dict(get_all_scenarios()))
+
+
+@lru_cache(maxsize=64)
+def _breach_bytes(breach_id: str) -> bytes:
+    _, _, case_study = load_scenario(breach_id)
+    return _dumps(_SER_CASE_STUDY(case_study, mode="json"))
+
+
 @app.get("/api/demo/scenarios")
 async def list_scenarios():
     """List all available demo scenarios."""
-    return get_all_scenarios()
+    return _bytes_response(_SCENARIOS_BYTES)
 
 
 # ─── Shared Analysis Pipeline ────────────────────────────────────────────────
 
-def _run_analysis_pipeline(
+def _analyze_one_goal(
+    scm: SCM,
+    goal: GoalPredicate,
+    algorithm: str,
+    max_mcs_cardinality: int,
+) -> tuple[InevitabilityResult, MCSResult, TheaterReport, ExplanationTree, list[ProofArtifact]]:
+    """Inevitability, MCS, theater, explanation and proofs for one goal.
+
+    Runs in a worker process, so it builds its own solver from the SCM.
+    """
+    solver = CausalSolver(scm)
+    mcs_extractor = MCSExtractor(solver, scm)
+    theater = TheaterDetector(solver, scm)
+    explainer = ExplainabilityEngine(scm)
+
+    inev = solver.compute_inevitability(goal)
+    mcs = mcs_extractor.extract_mcs(goal, max_cardinality=max_mcs_cardinality, algorithm=algorithm)
+
+    mcs_ids = frozenset().union(*(mcs_set.element_ids for mcs_set in mcs.mcs_sets))
+    theater_report = theater.classify_controls(goal, mcs_ids)
+
+    explanation = explainer.generate_explanation(goal, inev, mcs, theater_report)
+    proofs = mcs_extractor.generate_mcs_proofs(goal, mcs.mcs_sets)
+
+    return inev, mcs, theater_report, explanation, proofs
+
+
+async def _run_analysis_pipeline(
     graph: CausalGraph,
     goals: list[GoalPredicate],
     scenario_name: str,
@@ -118,7 +300,7 @@ def _run_analysis_pipeline(
     adversary_profile: str = "apt",
     run_monte_carlo: bool = True,
     mc_simulations: int = 10000,
-) -> dict:
+) -> Response:
     """Run the full analysis pipeline on a graph + goals. Shared by demo and custom endpoints."""
     start = time.perf_counter()
 
@@ -126,48 +308,83 @@ def _run_analysis_pipeline(
     builder = SCMBuilder(graph)
     scm = builder.build()
 
-    # Create solver
+    per_goal = None
+    pool = _POOL
+    if pool is not None:
+        # Run the independent per-goal analyses across worker processes
+        loop = asyncio.get_running_loop()
+        try:
+            per_goal = await asyncio.gather(*[
+                loop.run_in_executor(pool, _analyze_one_goal, scm, goal, algorithm, max_mcs_cardinality)
+                for goal in goals
+            ])
+        except BrokenProcessPool:
+            # A worker died (OOM, solver crash) and took the pool with it:
+            # later requests get a new pool, this one finishes serially
+            _replace_broken_pool(pool)
+    if per_goal is None:
+        # Without a working pool (outside the app's lifespan, e.g. the
+        # pipeline driven directly, or after it broke) the goals are
+        # analysed on the solver thread
+        per_goal = await _on_solver_thread(
+            lambda: [_analyze_one_goal(scm, goal, algorithm, max_mcs_cardinality) for goal in goals]
+        )
+
+    # Whole-model analyses need this process's solver, so they run on the solver thread
+    session_id, session, response = await _on_solver_thread(
+        _analyze_whole_model,
+        start, scm, goals, per_goal, scenario_name, organization, case_study,
+        adversary_profile, run_monte_carlo, mc_simulations,
+    )
+    _active_sessions[session_id] = session
+    return response
+
+
+def _analyze_whole_model(
+    start: float,
+    scm: SCM,
+    goals: list[GoalPredicate],
+    per_goal: list[tuple],
+    scenario_name: str,
+    organization: str,
+    case_study: BreachCaseStudy | None,
+    adversary_profile: str,
+    run_monte_carlo: bool,
+    mc_simulations: int,
+) -> tuple[str, dict, Response]:
+    """Cross-goal analyses, result assembly and rendering for one pipeline run.
+
+    Returns the new session ID, the session to store and the response.
+    """
+    # Imported on first use: advanced_features loads numba at import when it
+    # is installed, which is most of its import cost (NumPy is already loaded
+    # through probability_engine)
+    from .advanced_features import (
+        MultiGoalOptimizer, CertificationEngine, FailureForecaster,
+        GoalCollisionAnalyzer, AdversarialTester,
+    )
+
+    graph = scm.graph
+
+    # Create solver; one memoizing wrapper is shared by every engine that
+    # repeats the same inevitability queries
     solver = CausalSolver(scm)
+    cached_solver = CachedSolver(solver)
 
     # Create analysis engines
-    mcs_extractor = MCSExtractor(solver, scm)
-    theater = TheaterDetector(solver, scm)
     economic = EconomicAnalyzer()
-    collapse_engine = CollapseEngine(solver, scm)
-    explainer = ExplainabilityEngine(scm)
-    optimizer = MultiGoalOptimizer(solver, scm)
-    certifier = CertificationEngine(solver, scm)
-    forecaster = FailureForecaster(solver, scm)
-    collision_analyzer = GoalCollisionAnalyzer(solver, scm)
-    adversarial = AdversarialTester(solver, scm)
-
-    # Run analyses
-    inevitability_results = []
-    mcs_results = []
-    theater_reports = []
-    explanations = []
-    proof_artifacts = []
-
-    for goal in goals:
-        inev = solver.compute_inevitability(goal)
-        inevitability_results.append(inev)
-
-        mcs = mcs_extractor.extract_mcs(goal, max_cardinality=max_mcs_cardinality, algorithm=algorithm)
-        mcs_results.append(mcs)
-
-        mcs_ids = set()
-        for mcs_set in mcs.mcs_sets:
-            for elem in mcs_set.elements:
-                mcs_ids.add(elem.control_id)
-        theater_report = theater.classify_controls(goal, mcs_ids)
-        theater_reports.append(theater_report)
-
-        explanation = explainer.generate_explanation(goal, inev, mcs, theater_report)
-        explanations.append(explanation)
-
-        for mcs_set in mcs.mcs_sets:
-            proof = mcs_extractor.generate_mcs_proof(goal, mcs_set)
-            proof_artifacts.append(proof)
+    collapse_engine = CollapseEngine(cached_solver, scm)
+    optimizer = MultiGoalOptimizer(cached_solver, scm)
+    certifier = CertificationEngine(cached_solver, scm)
+    forecaster = FailureForecaster(cached_solver, scm)
+    collision_analyzer = GoalCollisionAnalyzer(cached_solver, scm)
+    adversarial = AdversarialTester(cached_solver, scm)
+
+    inevitability_results = [inev for inev, _, _, _, _ in per_goal]
+    mcs_results = [mcs for _, mcs, _, _, _ in per_goal]
+    theater_reports = [report for _, _, report, _, _ in per_goal]
+    explanations = [explanation for _, _, _, explanation, _ in per_goal]
+    proof_artifacts = [proof for _, _, _, _, proofs in per_goal for proof in proofs]
 
     econ_report = economic.analyze(theater_reports)
     fragility = collapse_engine.compute_fragility(goals)
@@ -210,14 +427,31 @@ def _run_analysis_pipeline(
         adversary_profile_used=adversary_profile,
     )
 
-    # Cache session for counterfactual queries
-    _active_sessions[result.analysis_id] = {
+    fragility_dumped = _SER_FRAGILITY(result.fragility_profile, mode="json")
+
+    # Session for counterfactual queries. Everything the read-only session
+    # endpoints return is fixed once the run finishes, so those payloads
+    # are rendered here once and served as bytes.
+    session = {
         "scm": scm,
-        "solver": solver,
+        "solver": cached_solver,
+        "counterfactual": CounterfactualEngine(cached_solver, scm),
         "goals": goals,
         "graph": graph,
         "case_study": case_study,
-        "result": result,
+        "collapse_bytes": _dumps({
+            "frames": _FRAMES_ADAPTER.dump_python(result.collapse_frames, mode="json"),
+            "total_frames": len(result.collapse_frames),
+            "fragility": fragility_dumped,
+        }),
+        "graph_bytes": _dumps({
+            "nodes": _NODES_ADAPTER.dump_python(scm.graph.nodes, mode="json"),
+            "edges": _EDGES_ADAPTER.dump_python(scm.graph.edges, mode="json"),
+            "assumptions": _ASSUMPTIONS_ADAPTER.dump_python(scm.assumptions, mode="json"),
+        }),
+        "optimize_bytes": _dumps({"strategies": optimization_strategies}),
+        "certify_bytes": _dumps(certification),
+        "forecast_bytes": _dumps(forecast),
     }
 
     response = {
@@ -226,15 +460,15 @@ def _run_analysis_pipeline(
         "engine_version": "2.0",
         "computation_time_ms": result.computation_time_ms,
         "adversary_profile": prob_results.get("adversary_profile"),
-        "inevitability_results": [r.model_dump() for r in result.inevitability_results],
-        "mcs_results": [r.model_dump() for r in result.mcs_results],
-        "theater_reports": [r.model_dump() for r in result.theater_reports],
-        "economic_report": result.economic_report.model_dump() if result.economic_report else None,
-        "fragility_profile": result.fragility_profile.model_dump() if result.fragility_profile else None,
-        "collapse_frames": [f.model_dump() for f in result.collapse_frames],
-        "explanations": [e.model_dump() for e in result.explanations],
-        "proof_artifacts": [p.model_dump() for p in result.proof_artifacts],
-        "collapse_ranking": [c.model_dump() for c in result.collapse_ranking],
+        "inevitability_results": _INEV_ADAPTER.dump_python(result.inevitability_results, mode="json"),
+        "mcs_results": _MCS_ADAPTER.dump_python(result.mcs_results, mode="json"),
+        "theater_reports": _THEATER_ADAPTER.dump_python(result.theater_reports, mode="json"),
+        "economic_report": _SER_ECONOMIC(result.economic_report, mode="json"),
+        "fragility_profile": fragility_dumped,
+        "collapse_frames": _FRAMES_ADAPTER.dump_python(result.collapse_frames, mode="json"),
+        "explanations": _EXPLANATIONS_ADAPTER.dump_python(result.explanations, mode="json"),
+        "proof_artifacts": _PROOFS_ADAPTER.dump_python(result.proof_artifacts, mode="json"),
+        "collapse_ranking": _RANKING_ADAPTER.dump_python(result.collapse_ranking, mode="json"),
         "optimization_strategies": optimization_strategies,
         "certification": certification,
         "forecast": forecast,
@@ -242,20 +476,20 @@ def _run_analysis_pipeline(
         "adversarial_report": adversarial_report,
         "probabilistic_results": prob_results,
         "graph": {
-            "nodes": [n.model_dump() for n in graph.nodes],
-            "edges": [e.model_dump() for e in graph.edges],
+            "nodes": _NODES_ADAPTER.dump_python(graph.nodes, mode="json"),
+            "edges": _EDGES_ADAPTER.dump_python(graph.edges, mode="json"),
         },
     }
 
     if case_study:
-        response["case_study"] = case_study.model_dump()
+        response["case_study"] = _SER_CASE_STUDY(case_study, mode="json")
 
-    return response
+    return result.analysis_id, session, _json_response(response)
 
 
 # ─── Run Demo Analysis ────────────────────────────────────────────────────────
 
-@app.post("/api/demo/run/{scenario_id}")
+@app.post("/api/demo/run/{scenario_id}", response_model=None)
 async def run_scenario(scenario_id: str, request: RunScenarioRequest | None = None):
     """Run a complete analysis on a pre-built breach scenario."""
     try:
@@ -269,7 +503,7 @@ async def run_scenario(scenario_id: str, request: RunScenarioRequest | None = No
     run_mc = request.run_monte_carlo if request else True
     mc_sims = request.mc_simulations if request else 10000
 
-    return _run_analysis_pipeline(
+    return await _run_analysis_pipeline(
         graph=graph,
         goals=goals,
         scenario_name=case_study.name,
@@ -294,20 +528,20 @@ def _validate_custom_graph(nodes: list[dict], edges: list[dict], goals: list[dic
 
     node_ids = {n.get("id", n.get("name", "")) for n in nodes}
 
-    # Validate edge references
-    for i, edge in enumerate(edges):
-        src = edge.get("source", "")
-        tgt = edge.get("target", "")
-        if src not in node_ids:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Edge {i}: source '{src}' does not match any node ID.",
-            )
-        if tgt not in node_ids:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Edge {i}: target '{tgt}' does not match any node ID.",
-            )
+    # Validate edge references: one set check for the common all-valid case,
+    # then locate the first offending edge only if something is missing.
+    srcs = [e.get("source", "") for e in edges]
+    tgts = [e.get("target", "") for e in edges]
+    if not node_ids.issuperset(srcs) or not node_ids.issuperset(tgts):
+        i, src, tgt = next(
+            (i, s, t) for i, (s, t) in enumerate(zip(srcs, tgts))
+            if s not in node_ids or t not in node_ids
+        )
+        end, ref = ("source", src) if src not in node_ids else ("target", tgt)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Edge {i}: {end} '{ref}' does not match any node ID.",
+        )
 
     # Warn (but don't block) if no controls exist
     has_control = any(n.get("type") == "control" for n in nodes)
@@ -316,30 +550,24 @@ def _validate_custom_graph(nodes: list[dict], edges: list[dict], goals: list[dic
         pass
 
 
-@app.post("/api/custom/run")
+@app.post("/api/custom/run", response_model=None)
 async def run_custom_analysis(request: CustomAnalysisRequest):
     """Run a complete analysis on a user-submitted infrastructure graph."""
     _validate_custom_graph(request.nodes, request.edges, request.goals)
 
-    # Build typed model objects from raw dicts
-    infra_nodes = []
+    # Use 'id' field if provided, otherwise auto-generate from 'name'
     for n in request.nodes:
-        # Use 'id' field if provided, otherwise auto-generate from 'name'
         if "id" not in n and "name" in n:
             n["id"] = n["name"].lower().replace(" ", "_")
-        infra_nodes.append(InfraNode(**n))
-
-    infra_edges = []
-    for e in request.edges:
-        infra_edges.append(InfraEdge(**e))
-
-    graph = CausalGraph(nodes=infra_nodes, edges=infra_edges)
 
-    goals = []
-    for g in request.goals:
-        goals.append(GoalPredicate(**g))
+    # Build typed model objects from raw dicts in one validation call each
+    graph = CausalGraph(
+        nodes=_NODES_ADAPTER.validate_python(request.nodes),
+        edges=_EDGES_ADAPTER.validate_python(request.edges),
+    )
+    goals = _GOALS_ADAPTER.validate_python(request.goals)
 
-    return _run_analysis_pipeline(
+    return await _run_analysis_pipeline(
         graph=graph,
         goals=goals,
         scenario_name=request.scenario_name,
@@ -354,54 +582,50 @@ async def run_custom_analysis(request: CustomAnalysisRequest):
 
 # ─── Counterfactual ──────────────────────────────────────────────────────────
 
-@app.post("/api/counterfactual")
+@app.post("/api/counterfactual", response_model=None)
 async def run_counterfactual(request: CounterfactualRequest):
     """Run a counterfactual what-if analysis."""
     session = _active_sessions.get(request.session_id)
     if not session:
         raise HTTPException(status_code=404, detail="No active session. Run an analysis first.")
 
-    solver = session["solver"]
     goals = session["goals"]
-    scm = session["scm"]
-    cf_engine = CounterfactualEngine(solver, scm)
+    cf_engine = session["counterfactual"]
 
-    results = {}
     target_goals = goals
     if request.goal_id:
         target_goals = [g for g in goals if g.id == request.goal_id]
 
-    for goal in target_goals:
-        result = cf_engine.what_if(goal, request.interventions)
-        results[goal.id] = result
+    results = await _on_solver_thread(cf_engine.what_if_batch, target_goals, request.interventions)
 
-    return {"counterfactual_results": results}
+    return _json_response({"counterfactual_results": results})
 
 
 # ─── Assumption Toggle ───────────────────────────────────────────────────────
 
-@app.post("/api/assumption/toggle")
+@app.post("/api/assumption/toggle", response_model=None)
 async def toggle_assumption(request: ToggleAssumptionRequest):
     """Toggle a control/assumption and get updated inevitability scores."""
     session = _active_sessions.get(request.session_id)
     if not session:
         raise HTTPException(status_code=404, detail="No active session. Run an analysis first.")
 
-    solver = session["solver"]
     goals = session["goals"]
-    scm = session["scm"]
-    cf_engine = CounterfactualEngine(solver, scm)
+    cf_engine = session["counterfactual"]
 
-    results = {}
     target_goals = goals
     if request.goal_id:
         target_goals = [g for g in goals if g.id == request.goal_id]
 
-    for goal in target_goals:
-        result = cf_engine.what_if(goal, {request.control_id: request.new_value})
-        results[goal.id] = result
+    results = await _on_solver_thread(
+        cf_engine.what_if_batch, target_goals, {request.control_id: request.new_value},
+    )
 
-    return {"toggle_results": results, "control_toggled": request.control_id, "new_value": request.new_value}
+    return _json_response({
+        "toggle_results": results,
+        "control_toggled": request.control_id,
+        "new_value": request.new_value,
+    })
 
 
 # ─── Breach Case Studies ─────────────────────────────────────────────────────
@@ -410,8 +634,7 @@ async def toggle_assumption(request: ToggleAssumptionRequest):
 async def get_breach(breach_id: str):
     """Get a historical breach case study."""
     try:
-        graph, goals, case_study = load_scenario(breach_id)
-        return case_study.model_dump()
+        return _bytes_response(_breach_bytes(breach_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -425,12 +648,7 @@ async def get_collapse_simulation(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="No active session.")
 
-    result = session["result"]
-    return {
-        "frames": [f.model_dump() for f in result.collapse_frames],
-        "total_frames": len(result.collapse_frames),
-        "fragility": result.fragility_profile.model_dump() if result.fragility_profile else None,
-    }
+    return _bytes_response(session["collapse_bytes"])
 
 
 # ─── Graph Data ──────────────────────────────────────────────────────────────
@@ -442,12 +660,7 @@ async def get_graph_data(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="No active session.")
 
-    scm = session["scm"]
-    return {
-        "nodes": [n.model_dump() for n in scm.graph.nodes],
-        "edges": [e.model_dump() for e in scm.graph.edges],
-        "assumptions": [a.model_dump() for a in scm.assumptions],
-    }
+    return _bytes_response(session["graph_bytes"])
 
 
 # ─── Advanced Feature Endpoints ────────────────────────────────────────────────
@@ -458,11 +671,7 @@ async def get_optimization(session_id: str):
     session = _active_sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="No active session.")
-    solver = session["solver"]
-    scm = session["scm"]
-    goals = session["goals"]
-    optimizer = MultiGoalOptimizer(solver, scm)
-    return {"strategies": optimizer.compute_optimal_strategies(goals)}
+    return _bytes_response(session["optimize_bytes"])
 
 
 @app.get("/api/advanced/certify/{session_id}")
@@ -471,13 +680,7 @@ async def get_certification(session_id: str):
     session = _active_sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="No active session.")
-    solver = session["solver"]
-    scm = session["scm"]
-    goals = session["goals"]
-    result = session["result"]
-    case_study = session["case_study"]
-    certifier = CertificationEngine(solver, scm)
-    return certifier.generate_certification(goals, result.inevitability_results, case_study.organization)
+    return _bytes_response(session["certify_bytes"])
 
 
 @app.get("/api/advanced/forecast/{session_id}")
@@ -486,12 +689,7 @@ async def get_forecast(session_id: str):
     session = _active_sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="No active session.")
-    solver = session["solver"]
-    scm = session["scm"]
-    goals = session["goals"]
-    result = session["result"]
-    forecaster = FailureForecaster(solver, scm)
-    return forecaster.forecast(goals, result.inevitability_results)
+    return _bytes_response(session["forecast_bytes"])
 
 
 # ─── v2.0: Adversary Profiles ────────────────────────────────────────────────
@@ -517,10 +715,5 @@ async def list_adversary_profiles():
 _frontend_dir = pathlib.Path(__file__).resolve().parent.parent / "frontend"
 
 
-@app.get("/")
-async def serve_root():
-    return FileResponse(_frontend_dir / "index.html")
-
-
-# Mount static files (CSS, JS, etc.) — MUST be after all API routes
-app.mount("/", StaticFiles(directory=str(_frontend_dir)), name="frontend")
+# Mount static files (index.html at "/", CSS, JS, etc.) — MUST be after all API routes
+app.mount("/", StaticFiles(directory=str(_frontend_dir), html=True), name="frontend")
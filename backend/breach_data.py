@@ -4,6 +4,10 @@ Pre-built SCMs reconstructed from real-world breaches for demo and validation.
 """
 
 from __future__ import annotations
+import copy as _copy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Final, Mapping
 from .models import (
     CausalGraph, InfraNode, InfraEdge, GoalPredicate, BreachCaseStudy, AttackStep,
     NodeType, EdgeType, EdgeConstraint, ConstraintType, ControlState,
@@ -11,52 +15,57 @@ from .models import (
 )
 
 
-def get_all_scenarios() -> dict[str, dict]:
-    """Get all available demo scenarios."""
-    return {
-        "solarwinds": {
-            "name": "SolarWinds Supply Chain Attack (2020)",
-            "description": "Nation-state supply chain compromise → SAML forging → email exfiltration",
-            "year": 2020,
-            "expected_inev": 0.92,
-        },
-        "capital_one": {
-            "name": "Capital One Data Breach (2019)",
-            "description": "SSRF → IMDS → IAM role → S3 bucket exfiltration",
-            "year": 2019,
-            "expected_inev": 0.78,
-        },
-        "enterprise_demo": {
-            "name": "Synthetic Enterprise Environment",
-            "description": "Realistic enterprise with AD, cloud, and CI/CD — multiple attack goals",
-            "year": 2024,
-            "expected_inev": 0.65,
-        },
-        "okta": {
-            "name": "Okta / Lapsus$ Breach (2022)",
-            "description": "Third-party contractor compromise → customer tenant access → 366 orgs affected",
-            "year": 2022,
-            "expected_inev": 0.85,
-        },
-        "log4shell": {
-            "name": "Log4Shell / CVE-2021-44228",
-            "description": "JNDI injection → RCE → cloud credential theft → S3 exfiltration",
-            "year": 2021,
-            "expected_inev": 0.95,
-        },
-        "equifax": {
-            "name": "Equifax Data Breach (2017)",
-            "description": "Apache Struts CVE → web shell → plaintext creds → 148M records over 76 days",
-            "year": 2017,
-            "expected_inev": 0.97,
-        },
-    }
+# Demo scenario catalogue; the listing never changes at runtime
+_ALL_SCENARIOS: Final[Mapping[str, dict]] = MappingProxyType({
+    "solarwinds": {
+        "name": "SolarWinds Supply Chain Attack (2020)",
+        "description": "Nation-state supply chain compromise → SAML forging → email exfiltration",
+        "year": 2020,
+        "expected_inev": 0.92,
+    },
+    "capital_one": {
+        "name": "Capital One Data Breach (2019)",
+        "description": "SSRF → IMDS → IAM role → S3 bucket exfiltration",
+        "year": 2019,
+        "expected_inev": 0.78,
+    },
+    "enterprise_demo": {
+        "name": "Synthetic Enterprise Environment",
+        "description": "Realistic enterprise with AD, cloud, and CI/CD — multiple attack goals",
+        "year": 2024,
+        "expected_inev": 0.65,
+    },
+    "okta": {
+        "name": "Okta / Lapsus$ Breach (2022)",
+        "description": "Third-party contractor compromise → customer tenant access → 366 orgs affected",
+        "year": 2022,
+        "expected_inev": 0.85,
+    },
+    "log4shell": {
+        "name": "Log4Shell / CVE-2021-44228",
+        "description": "JNDI injection → RCE → cloud credential theft → S3 exfiltration",
+        "year": 2021,
+        "expected_inev": 0.95,
+    },
+    "equifax": {
+        "name": "Equifax Data Breach (2017)",
+        "description": "Apache Struts CVE → web shell → plaintext creds → 148M records over 76 days",
+        "year": 2017,
+        "expected_inev": 0.97,
+    },
+})
+
+
+def get_all_scenarios() -> Mapping[str, dict]:
+    """Get all available demo scenarios (a shared, read-only mapping)."""
+    return _ALL_SCENARIOS
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SOLARWINDS 2020
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def build_solarwinds() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
     """Reconstruct the SolarWinds Sunburst supply chain attack (2020)."""
 
@@ -184,6 +193,7 @@ def build_solarwinds() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStud
 # CAPITAL ONE 2019
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def build_capital_one() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
     """Reconstruct the Capital One data breach (2019)."""
 
@@ -291,6 +301,7 @@ def build_capital_one() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStu
 # SYNTHETIC ENTERPRISE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def build_enterprise_demo() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
     """Build a synthetic enterprise environment with multiple attack goals."""
 
@@ -423,6 +434,7 @@ def build_enterprise_demo() -> tuple[CausalGraph, list[GoalPredicate], BreachCas
 # OKTA / LAPSUS$ (2022)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def build_okta() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
     """Okta / Lapsus$ breach — third-party contractor compromise → customer tenant access."""
     graph = CausalGraph(
@@ -488,6 +500,7 @@ def build_okta() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
 # LOG4SHELL (2021)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def build_log4shell() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
     """Log4Shell (CVE-2021-44228) — RCE through logging → lateral movement → cloud takeover."""
     graph = CausalGraph(
@@ -569,6 +582,7 @@ def build_log4shell() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy
 # EQUIFAX (2017)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def build_equifax() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
     """Equifax breach — Apache Struts CVE → 147M records exfiltrated."""
     graph = CausalGraph(
@@ -637,19 +651,30 @@ def build_equifax() -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
 # LOADER
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def load_scenario(scenario_id: str) -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
-    """Load a pre-built scenario by ID."""
-    builders = {
-        "solarwinds": build_solarwinds,
-        "capital_one": build_capital_one,
-        "enterprise_demo": build_enterprise_demo,
-        "okta": build_okta,
-        "log4shell": build_log4shell,
-        "equifax": build_equifax,
-    }
-
-    builder = builders.get(scenario_id)
+# Scenario registry. Nothing is built until a scenario is first loaded; each
+# builder then caches its own result.
+_BUILDERS: Final[Mapping[str, Callable[[], tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]]]] = MappingProxyType({
+    "solarwinds": build_solarwinds,
+    "capital_one": build_capital_one,
+    "enterprise_demo": build_enterprise_demo,
+    "okta": build_okta,
+    "log4shell": build_log4shell,
+    "equifax": build_equifax,
+})
+
+
+def load_scenario(
+    scenario_id: str, copy: bool = False
+) -> tuple[CausalGraph, list[GoalPredicate], BreachCaseStudy]:
+    """Load a pre-built scenario by ID.
+
+    Each scenario is built once per process and the same objects are returned
+    on every call, so callers must treat them as read-only. Pass ``copy=True``
+    to get a private deep copy that is safe to mutate.
+    """
+    builder = _BUILDERS.get(scenario_id)
     if not builder:
-        raise ValueError(f"Unknown scenario: {scenario_id}. Available: {list(builders.keys())}")
+        raise ValueError(f"Unknown scenario: {scenario_id}. Available: {list(_BUILDERS.keys())}")
 
-    return builder()
+    scenario = builder()
+    return _copy.deepcopy(scenario) if copy else scenario
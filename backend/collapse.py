@@ -34,11 +34,14 @@ class CollapseEngine:
         total_inev_increase = 0.0
         spof = 0
 
+        interventions_on = self._with_control({}, control_id, True)
+        interventions_off = self._with_control({}, control_id, False)
+
         for goal in goals:
             # Score with control active
-            score_before = self.solver.compute_inevitability(goal, {control_id: True})
+            score_before = self.solver.compute_inevitability(goal, interventions_on)
             # Score with control disabled
-            score_after = self.solver.compute_inevitability(goal, {control_id: False})
+            score_after = self.solver.compute_inevitability(goal, interventions_off)
             delta = score_after.score - score_before.score
 
             if score_before.score < goal.threshold and score_after.score >= goal.threshold:
@@ -84,12 +87,17 @@ class CollapseEngine:
         total_goals = len(goals)
         total_controls = len(controls)
 
+        # One pass over the metrics for every radius tally
+        radius_sum = spof_count = high_collapse = 0
+        for m in metrics:
+            radius_sum += m.collapse_radius
+            spof_count += m.collapse_radius == total_goals
+            high_collapse += m.collapse_radius > total_goals / 2
+
         # AFI = average normalized collapse radius
-        avg_collapse = sum(m.collapse_radius for m in metrics) / total_controls if total_controls > 0 else 0
+        avg_collapse = radius_sum / total_controls if total_controls > 0 else 0
         afi = avg_collapse / total_goals if total_goals > 0 else 0
 
-        spof_count = sum(1 for m in metrics if m.collapse_radius == total_goals)
-        high_collapse = sum(1 for m in metrics if m.collapse_radius > total_goals / 2)
         brittleness = spof_count / total_controls if total_controls > 0 else 0
 
         # Grade
@@ -105,7 +113,7 @@ class CollapseEngine:
             grade = FragilityGrade.F
 
         # Anti-patterns
-        anti_patterns = self._detect_anti_patterns(metrics, goals)
+        anti_patterns = self._detect_anti_patterns(metrics, goals, avg_collapse)
 
         return FragilityProfile(
             afi=round(afi, 3),
@@ -153,7 +161,7 @@ class CollapseEngine:
         ))
 
         # Progressive collapse: recompute metrics after each disable
-        prev_goal_states = dict(frame0_goals)
+        prev_goal_states = frame0_goals
         step_counter = 0
         all_controls = self.scm.graph.get_controls()
         max_steps = len(all_controls)  # Safety limit
@@ -168,10 +176,8 @@ class CollapseEngine:
                     continue
 
                 # Compute impact of disabling this control given current state
-                interventions_on = dict(disabled_controls)
-                interventions_on[ctrl.id] = True
-                interventions_off = dict(disabled_controls)
-                interventions_off[ctrl.id] = False
+                interventions_on = self._with_control(disabled_controls, ctrl.id, True)
+                interventions_off = self._with_control(disabled_controls, ctrl.id, False)
 
                 goals_collapsed = 0
                 total_increase = 0.0
@@ -254,12 +260,36 @@ class CollapseEngine:
                 narration=narration,
             ))
 
-            prev_goal_states = dict(goal_states)
+            prev_goal_states = goal_states
 
         return frames
 
     # ── Helpers ───────────────────────────────────────────────────────────
 
+    def _with_control(
+        self,
+        interventions: dict[str, bool],
+        control_id: str,
+        value: bool,
+    ) -> dict[str, bool]:
+        """Return interventions plus do(control := value).
+
+        The solver already fixes a root control to its configured state, so
+        pinning it to that same state changes nothing; the interventions are
+        then returned as-is and the memoized solve for them is reused.
+        """
+        node = self.scm.graph.get_node(control_id)
+        if (
+            node is not None
+            and control_id not in interventions
+            and not self.scm.graph.edges_by_target.get(control_id)
+            and (node.control_state == ControlState.ACTIVE) == value
+        ):
+            return interventions
+        pinned = dict(interventions)
+        pinned[control_id] = value
+        return pinned
+
     def _classify_status(self, score: float, threshold: float) -> str:
         if score >= threshold:
             return "inevitable"
@@ -274,14 +304,24 @@ class CollapseEngine:
         interventions: dict[str, bool],
     ) -> dict:
         """Compute color/status for each node based on goal inevitability."""
+        # Max inevitability among the goals each node affects; every goal
+        # is solved once, not once per node that references it
+        max_scores: dict[str, float] = {}
+        nodes_by_id = self.scm.graph.nodes_by_id
+        for goal in goals:
+            affected = [
+                nid for nid in dict.fromkeys((*goal.target_assets, *goal.required_conditions))
+                if nid in nodes_by_id
+            ]
+            if not affected:
+                continue
+            score = self.solver.compute_inevitability(goal, interventions).score
+            for nid in affected:
+                max_scores[nid] = max(max_scores.get(nid, 0.0), score)
+
         node_states = {}
         for node in self.scm.graph.nodes:
-            # Find max inevitability among goals that this node affects
-            max_score = 0.0
-            for goal in goals:
-                if node.id in goal.target_assets or node.id in goal.required_conditions:
-                    result = self.solver.compute_inevitability(goal, interventions)
-                    max_score = max(max_score, result.score)
+            max_score = max_scores.get(node.id, 0.0)
 
             if max_score >= 0.7:
                 color = "#ef4444"  # Red
@@ -307,8 +347,12 @@ class CollapseEngine:
         self,
         metrics: list[CollapseMetrics],
         goals: list[GoalPredicate],
+        avg_collapse: float,
     ) -> list[dict]:
-        """Detect architectural anti-patterns from collapse metrics."""
+        """Detect architectural anti-patterns from collapse metrics.
+
+        avg_collapse is the mean collapse radius over metrics.
+        """
         patterns = []
         total_goals = len(goals)
 
@@ -324,14 +368,12 @@ class CollapseEngine:
                 })
 
         # High average collapse
-        if metrics:
-            avg_collapse = sum(m.collapse_radius for m in metrics) / len(metrics)
-            if avg_collapse > total_goals * 0.3:
-                patterns.append({
-                    "name": "HIGH_AVERAGE_COLLAPSE",
-                    "severity": "HIGH",
-                    "description": f"Average collapse radius is {avg_collapse:.1f}/{total_goals} — architecture is fragile",
-                    "fix": "Implement defense-in-depth with independent control layers",
-                })
+        if metrics and avg_collapse > total_goals * 0.3:
+            patterns.append({
+                "name": "HIGH_AVERAGE_COLLAPSE",
+                "severity": "HIGH",
+                "description": f"Average collapse radius is {avg_collapse:.1f}/{total_goals} — architecture is fragile",
+                "fix": "Implement defense-in-depth with independent control layers",
+            })
 
         return patterns
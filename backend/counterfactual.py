@@ -27,31 +27,50 @@ class CounterfactualEngine:
         
         Returns the before/after inevitability comparison.
         """
-        # Baseline
-        baseline = self.solver.compute_inevitability(goal, baseline_interventions)
+        return self.what_if_batch([goal], interventions, baseline_interventions)[goal.id]
 
-        # After intervention
+    def what_if_batch(
+        self,
+        goals: list[GoalPredicate],
+        interventions: dict[str, bool],
+        baseline_interventions: dict[str, bool] | None = None,
+    ) -> dict[str, dict]:
+        """Run the same what-if query against several goals, keyed by goal ID.
+
+        The merged intervention set and its description are built once and
+        shared by every goal.
+        """
         merged = dict(baseline_interventions or {})
         merged.update(interventions)
-        after = self.solver.compute_inevitability(goal, merged)
-
-        delta = after.score - baseline.score
-        direction = "INCREASED" if delta > 0 else "DECREASED" if delta < 0 else "UNCHANGED"
-
-        explanation = self._explain_delta(goal, interventions, baseline, after)
-
-        return {
-            "goal": goal.name,
-            "before": baseline.score,
-            "after": after.score,
-            "delta": round(delta, 3),
-            "direction": direction,
-            "is_inevitable_before": baseline.is_inevitable,
-            "is_inevitable_after": after.is_inevitable,
-            "crossed_threshold": baseline.is_inevitable != after.is_inevitable,
-            "interventions_applied": interventions,
-            "explanation": explanation,
-        }
+        intervention_text = self._describe_interventions(interventions)
+
+        results = {}
+        for goal in goals:
+            # Baseline
+            baseline = self.solver.compute_inevitability(goal, baseline_interventions)
+
+            # After intervention
+            after = self.solver.compute_inevitability(goal, merged)
+
+            delta = after.score - baseline.score
+            direction = "INCREASED" if delta > 0 else "DECREASED" if delta < 0 else "UNCHANGED"
+
+            explanation = self._explain_delta(goal, intervention_text, baseline, after)
+
+            results[goal.id] = {
+                "goal": goal.name,
+                "before": baseline.score,
+                "after": after.score,
+                "delta": round(delta, 3),
+                "direction": direction,
+                "is_inevitable_before": baseline.is_inevitable,
+                "is_inevitable_after": after.is_inevitable,
+                "crossed_threshold": baseline.is_inevitable != after.is_inevitable,
+                "interventions_applied": interventions,
+                "explanation": explanation,
+            }
+
+        return results
 
     def toggle_assumption(
         self,
@@ -84,14 +103,25 @@ class CounterfactualEngine:
         goal: GoalPredicate,
         baseline_interventions: dict[str, bool] | None = None,
     ) -> list[dict]:
-        """Compute sensitivity: how much does each variable affect inevitability?"""
+        """Compute sensitivity: how much does each variable affect inevitability?
+
+        Only ancestors of the goal's variables are toggled; pinning any other
+        node leaves the goal's satisfiability, and so its score, unchanged.
+        """
         results = []
         baseline = self.solver.compute_inevitability(goal, baseline_interventions)
+        relevant = self.scm.graph.get_ancestors((*goal.target_assets, *goal.required_conditions))
+        pinned = baseline_interventions or {}
 
         for node in self.scm.graph.nodes:
-            # Toggle this variable and measure impact
+            if node.id not in relevant:
+                continue
+            # Toggle this variable and measure impact; re-pinning the
+            # baseline's own value would just reproduce the baseline
             for value in [True, False]:
-                interventions = dict(baseline_interventions or {})
+                if pinned.get(node.id) == value:
+                    continue
+                interventions = dict(pinned)
                 interventions[node.id] = value
                 after = self.solver.compute_inevitability(goal, interventions)
                 delta = after.score - baseline.score
@@ -110,22 +140,23 @@ class CounterfactualEngine:
         results.sort(key=lambda x: abs(x["delta"]), reverse=True)
         return results
 
-    def _explain_delta(
-        self,
-        goal: GoalPredicate,
-        interventions: dict[str, bool],
-        before: InevitabilityResult,
-        after: InevitabilityResult,
-    ) -> str:
-        """Generate a human-readable explanation of the delta."""
+    def _describe_interventions(self, interventions: dict[str, bool]) -> str:
         parts = []
         for var_id, value in interventions.items():
             node = self.scm.graph.get_node(var_id)
             name = node.name if node else var_id
             action = "enabled" if value else "disabled"
             parts.append(f"{name} {action}")
+        return ", ".join(parts)
 
-        intervention_text = ", ".join(parts)
+    def _explain_delta(
+        self,
+        goal: GoalPredicate,
+        intervention_text: str,
+        before: InevitabilityResult,
+        after: InevitabilityResult,
+    ) -> str:
+        """Generate a human-readable explanation of the delta."""
         delta = after.score - before.score
 
         if abs(delta) < 0.01:
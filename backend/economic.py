@@ -4,6 +4,7 @@ Maps security spend to causal relevance, identifies waste, and computes ROI.
 """
 
 from __future__ import annotations
+import heapq
 from .models import (
     TheaterReport, EconomicReport, ControlClassification,
     DefenseClassification
@@ -15,29 +16,39 @@ class EconomicAnalyzer:
 
     def analyze(self, theater_reports: list[TheaterReport]) -> EconomicReport:
         """Compute economic impact from theater classification results."""
+        # One pass dedups controls across goals and accumulates every total
         all_classifications: list[ControlClassification] = []
+        irrelevant: list[ControlClassification] = []
         seen_controls = set()
+        total_spend = wasted = partial_waste = critical_budget = mcs_cost = 0
 
         for report in theater_reports:
             for c in report.classifications:
-                if c.control_id not in seen_controls:
-                    seen_controls.add(c.control_id)
-                    all_classifications.append(c)
+                if c.control_id in seen_controls:
+                    continue
+                seen_controls.add(c.control_id)
+                all_classifications.append(c)
+
+                cost = c.annual_cost
+                total_spend += cost
+                if c.classification == DefenseClassification.IRRELEVANT:
+                    wasted += cost
+                    irrelevant.append(c)
+                elif c.classification == DefenseClassification.PARTIAL:
+                    partial_waste += cost * 0.5
+                elif c.classification == DefenseClassification.CRITICAL:
+                    critical_budget += cost
+                    mcs_cost += cost
+                elif c.classification == DefenseClassification.NECESSARY:
+                    mcs_cost += cost
 
-        total_spend = sum(c.annual_cost for c in all_classifications)
-        wasted = sum(c.annual_cost for c in all_classifications if c.classification == DefenseClassification.IRRELEVANT)
-        partial_waste = sum(c.annual_cost * 0.5 for c in all_classifications if c.classification == DefenseClassification.PARTIAL)
         effective = total_spend - wasted - partial_waste
 
         # Top waste controls
-        waste_controls = sorted(
-            [c for c in all_classifications if c.classification == DefenseClassification.IRRELEVANT],
-            key=lambda x: x.annual_cost,
-            reverse=True,
-        )
+        waste_controls = heapq.nlargest(5, irrelevant, key=lambda x: x.annual_cost)
 
         # ROI projections for remediation
-        roi_projections = self._compute_roi(all_classifications, total_spend)
+        roi_projections = self._compute_roi(total_spend, wasted, critical_budget, mcs_cost)
 
         # Recommendations
         recommendations = self._generate_recommendations(all_classifications, total_spend, wasted)
@@ -49,17 +60,27 @@ class EconomicAnalyzer:
             partial_waste=round(partial_waste, 2),
             waste_ratio=round(wasted / total_spend, 3) if total_spend > 0 else 0.0,
             efficiency_ratio=round(effective / total_spend, 3) if total_spend > 0 else 0.0,
-            top_waste_controls=waste_controls[:5],
+            top_waste_controls=waste_controls,
             remediation_recommendations=recommendations,
             roi_projections=roi_projections,
         )
 
-    def _compute_roi(self, classifications: list[ControlClassification], total_spend: float) -> list[dict]:
-        """Compute ROI for different remediation strategies."""
+    def _compute_roi(
+        self,
+        total_spend: float,
+        theater_savings: float,
+        critical_budget: float,
+        mcs_cost: float,
+    ) -> list[dict]:
+        """Compute ROI for different remediation strategies.
+
+        Takes the spend totals analyze() has already accumulated: all
+        controls, irrelevant (theater) controls, critical controls, and
+        controls in at least one MCS (critical or necessary).
+        """
         projections = []
 
         # Strategy 1: Eliminate theater controls
-        theater_savings = sum(c.annual_cost for c in classifications if c.classification == DefenseClassification.IRRELEVANT)
         if theater_savings > 0:
             projections.append({
                 "strategy": "Eliminate Security Theater",
@@ -72,7 +93,6 @@ class EconomicAnalyzer:
             })
 
         # Strategy 2: Reallocate to critical controls
-        critical_budget = sum(c.annual_cost for c in classifications if c.classification == DefenseClassification.CRITICAL)
         if theater_savings > 0 and critical_budget > 0:
             projections.append({
                 "strategy": "Reallocate Theater Budget to Critical Controls",
@@ -85,7 +105,6 @@ class EconomicAnalyzer:
             })
 
         # Strategy 3: Implement MCS-only defense
-        mcs_cost = sum(c.annual_cost for c in classifications if c.classification in (DefenseClassification.CRITICAL, DefenseClassification.NECESSARY))
         if mcs_cost < total_spend:
             projections.append({
                 "strategy": "MCS-Only Defense Posture",
@@ -8,7 +8,7 @@ import time
 import itertools
 from .models import (
     SCM, GoalPredicate, MCSResult, MCSSet, MCSElement,
-    SolverStatus, NodeType, ProofArtifact
+    SolverStatus, NodeType, ProofArtifact, SolverResult
 )
 from .solver_engine import CausalSolver
 
@@ -202,26 +202,45 @@ class MCSExtractor:
 
     def generate_mcs_proof(self, goal: GoalPredicate, mcs: MCSSet) -> ProofArtifact:
         """Generate a proof artifact for an MCS claim."""
-        # Verify MCS blocks the goal
-        interventions = {e.control_id: True for e in mcs.elements}
-        blocking_result = self.solver.check_satisfiability(goal, interventions)
-
-        # Verify minimality — each proper subset still allows the goal
-        minimality_checks = {}
-        for element in mcs.elements:
-            subset = {e.control_id: True for e in mcs.elements if e.control_id != element.control_id}
-            sub_result = self.solver.check_satisfiability(goal, subset)
-            minimality_checks[element.control_name] = sub_result.status.value
-
-        return ProofArtifact(
-            proof_type="mcs_blocking",
-            claim=f"Controls {{{', '.join(e.control_name for e in mcs.elements)}}} form an MCS for goal '{goal.name}'",
-            goal_id=goal.id,
-            evidence={
-                "blocking_verified": blocking_result.status == SolverStatus.UNSAT,
-                "minimality_checks": minimality_checks,
-                "all_subsets_sat": all(v == "sat" for v in minimality_checks.values()),
-            },
-            solver_used="z3",
-            verification_time_ms=blocking_result.solve_time_ms,
-        )
+        return self.generate_mcs_proofs(goal, [mcs])[0]
+
+    def generate_mcs_proofs(self, goal: GoalPredicate, mcs_sets: list[MCSSet]) -> list[ProofArtifact]:
+        """Generate proof artifacts for every MCS claim on one goal.
+
+        Intervention sets shared between claims (overlapping subsets in the
+        minimality checks) are solved once for the whole batch.
+        """
+        checked: dict[frozenset[str], SolverResult] = {}
+
+        def check(control_ids: frozenset[str]) -> SolverResult:
+            if control_ids not in checked:
+                checked[control_ids] = self.solver.check_satisfiability(
+                    goal, dict.fromkeys(control_ids, True)
+                )
+            return checked[control_ids]
+
+        proofs = []
+        for mcs in mcs_sets:
+            # Verify MCS blocking the goal
+            ids = mcs.element_ids
+            blocking_result = check(ids)
+
+            # Verify minimality — each proper subset still allows the goal
+            minimality_checks = {
+                element.control_name: check(ids - {element.control_id}).status.value
+                for element in mcs.elements
+            }
+
+            proofs.append(ProofArtifact(
+                proof_type="mcs_blocking",
+                claim=f"Controls {{{', '.join(e.control_name for e in mcs.elements)}}} form an MCS for goal '{goal.name}'",
+                goal_id=goal.id,
+                evidence={
+                    "blocking_verified": blocking_result.status == SolverStatus.UNSAT,
+                    "minimality_checks": minimality_checks,
+                    "all_subsets_sat": all(v == "sat" for v in minimality_checks.values()),
+                },
+                solver_used="z3",
+                verification_time_ms=blocking_result.solve_time_ms,
+            ))
+        return proofs
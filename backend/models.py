@@ -4,8 +4,9 @@ Pydantic models for the Structural Causal Model (SCM) based cybersecurity analys
 """
 
 from __future__ import annotations
-from pydantic import BaseModel, Field
-from typing import Optional
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Iterable, Optional
 from enum import Enum
 import uuid
 
@@ -85,6 +86,8 @@ class FragilityGrade(str, Enum):
 # ─── Infrastructure Nodes ────────────────────────────────────────────────────
 
 class InfraNode(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     type: NodeType
     name: str
@@ -111,19 +114,27 @@ class InfraNode(BaseModel):
 
 
 class EdgeConstraint(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: ConstraintType = ConstraintType.DETERMINISTIC
     preconditions: list[str] = Field(default_factory=list)
     assumptions: list[str] = Field(default_factory=list)
     confidence: float = 1.0
 
 
+# Edges without an explicit constraint all share this one (flyweight)
+_DETERMINISTIC_CONSTRAINT = EdgeConstraint()
+
+
 class InfraEdge(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     source: str  # Node ID
     target: str  # Node ID
     edge_type: EdgeType
     label: str = ""
-    constraint: EdgeConstraint = Field(default_factory=EdgeConstraint)
+    constraint: EdgeConstraint = Field(default_factory=lambda: _DETERMINISTIC_CONSTRAINT)
     weight: float = 1.0
     exploit_probability: float = 0.5  # v2.0: likelihood of exploit success (0.0–1.0)
 
@@ -135,26 +146,63 @@ class CausalGraph(BaseModel):
     edges: list[InfraEdge] = Field(default_factory=list)
     metadata: dict = Field(default_factory=dict)
 
-    def get_node(self, node_id: str) -> Optional[InfraNode]:
+    @cached_property
+    def nodes_by_id(self) -> dict[str, InfraNode]:
+        """Nodes keyed by ID, first occurrence winning (built on first access)."""
+        index: dict[str, InfraNode] = {}
         for n in self.nodes:
-            if n.id == node_id:
-                return n
-        return None
+            index.setdefault(n.id, n)
+        return index
+
+    @cached_property
+    def edges_by_source(self) -> dict[str, list[InfraEdge]]:
+        """Outgoing edges per node, in edge order (built on first access)."""
+        index: dict[str, list[InfraEdge]] = {}
+        for e in self.edges:
+            index.setdefault(e.source, []).append(e)
+        return index
+
+    @cached_property
+    def edges_by_target(self) -> dict[str, list[InfraEdge]]:
+        """Incoming edges per node, in edge order (built on first access)."""
+        index: dict[str, list[InfraEdge]] = {}
+        for e in self.edges:
+            index.setdefault(e.target, []).append(e)
+        return index
+
+    @cached_property
+    def controls(self) -> tuple[InfraNode, ...]:
+        """Control nodes in node order (built on first access)."""
+        return tuple(n for n in self.nodes if n.type == NodeType.CONTROL)
+
+    def get_node(self, node_id: str) -> Optional[InfraNode]:
+        return self.nodes_by_id.get(node_id)
 
     def get_controls(self) -> list[InfraNode]:
-        return [n for n in self.nodes if n.type == NodeType.CONTROL]
+        return list(self.controls)
 
     def get_edges_from(self, node_id: str) -> list[InfraEdge]:
-        return [e for e in self.edges if e.source == node_id]
+        return list(self.edges_by_source.get(node_id, ()))
 
     def get_edges_to(self, node_id: str) -> list[InfraEdge]:
-        return [e for e in self.edges if e.target == node_id]
+        return list(self.edges_by_target.get(node_id, ()))
 
     def get_parents(self, node_id: str) -> list[str]:
-        return [e.source for e in self.edges if e.target == node_id]
+        return [e.source for e in self.edges_by_target.get(node_id, ())]
 
     def get_children(self, node_id: str) -> list[str]:
-        return [e.target for e in self.edges if e.source == node_id]
+        return [e.target for e in self.edges_by_source.get(node_id, ())]
+
+    def get_ancestors(self, node_ids: Iterable[str]) -> set[str]:
+        """The given nodes plus every node with a directed path to one of them."""
+        seen = set(node_ids)
+        stack = list(seen)
+        while stack:
+            for e in self.edges_by_target.get(stack.pop(), ()):
+                if e.source not in seen:
+                    seen.add(e.source)
+                    stack.append(e.source)
+        return seen
 
 
 # ─── Structural Causal Model ────────────────────────────────────────────────
@@ -186,10 +234,26 @@ class SCM(BaseModel):
     node_metadata: dict = Field(default_factory=dict)
     version: str = "1.0"
 
+    @cached_property
+    def equations_by_target(self) -> dict[str, StructuralEquation]:
+        """Structural equations keyed by target variable (built on first access)."""
+        return {eq.target_variable: eq for eq in self.equations}
+
+    @cached_property
+    def controls_by_state(self) -> dict[Optional[ControlState], list[InfraNode]]:
+        """Control nodes grouped by control state, in metadata order."""
+        index: dict[Optional[ControlState], list[InfraNode]] = {}
+        for meta in self.node_metadata.values():
+            if meta.type == NodeType.CONTROL:
+                index.setdefault(meta.control_state, []).append(meta)
+        return index
+
 
 # ─── Goal Predicates ─────────────────────────────────────────────────────────
 
 class GoalPredicate(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
     description: str = ""
@@ -242,6 +306,11 @@ class MCSSet(BaseModel):
     feasibility: str = "immediate"
     validated: bool = False
 
+    @cached_property
+    def element_ids(self) -> frozenset[str]:
+        """Control IDs in this cut set (built on first access)."""
+        return frozenset(e.control_id for e in self.elements)
+
 
 class MCSResult(BaseModel):
     goal_id: str
@@ -382,6 +451,8 @@ class AnalysisResult(BaseModel):
 # ─── Breach Case Study ──────────────────────────────────────────────────────
 
 class AttackStep(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     step: int
     technique: str = ""
     technique_id: str = ""  # MITRE ATT&CK ID
@@ -390,6 +461,8 @@ class AttackStep(BaseModel):
 
 
 class BreachCaseStudy(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     breach_id: str
     name: str
     organization: str
@@ -7,9 +7,10 @@ Computes path risk, goal risk, Monte Carlo simulations, and control impact ranki
 from __future__ import annotations
 import random
 import math
-from collections import defaultdict
+from collections import defaultdict, deque
+import numpy as np
 from .models import (
-    SCM, CausalGraph, GoalPredicate, InfraNode, InfraEdge,
+    SCM, CausalGraph, GoalPredicate, InfraNode,
     InevitabilityResult, NodeType, ControlState,
 )
 
@@ -41,6 +42,75 @@ ADVERSARY_PROFILES = {
 }
 
 
+# Control states as small ints for the array view (None counts as inactive)
+_INACTIVE, _ACTIVE, _PARTIAL = 0, 1, 2
+_STATE_CODES = {ControlState.ACTIVE: _ACTIVE, ControlState.PARTIAL: _PARTIAL}
+
+
+# ─── Monte Carlo kernels ─────────────────────────────────────────────────────
+# A simulation run is flattened into roll thresholds: path p owns
+# thresholds[path_ptr[p]:path_ptr[p + 1]] (each hop's exploit roll followed by
+# its guarding controls' bypass rolls) and succeeds when every roll lands at
+# or below its threshold. Both kernels return the number of simulations in
+# which at least one path succeeded.
+
+def _mc_numpy(thresholds, path_ptr, n_simulations, seed):
+    """Vectorised kernel: draws every roll up front, in bounded chunks."""
+    rng = np.random.default_rng(seed)
+    n_rolls = thresholds.shape[0]
+    chunk = max(1, (1 << 20) // max(n_rolls, 1))
+    successes = 0
+    for start in range(0, n_simulations, chunk):
+        rows = min(chunk, n_simulations - start)
+        held = rng.random((rows, n_rolls)) <= thresholds
+        succeeded = np.zeros(rows, dtype=bool)
+        for p in range(path_ptr.shape[0] - 1):
+            succeeded |= held[:, path_ptr[p]:path_ptr[p + 1]].all(axis=1)
+        successes += int(np.count_nonzero(succeeded))
+    return successes
+
+
+def _mc_compiled(thresholds, path_ptr, n_simulations, seed):
+    """Equivalent of _mc_numpy that stops rolling a path at its first failure.
+
+    Meant to be compiled with numba; see _monte_carlo_kernel.
+    """
+    np.random.seed(seed)
+    n_paths = path_ptr.shape[0] - 1
+    successes = 0
+    for _ in range(n_simulations):
+        for p in range(n_paths):
+            held = True
+            for k in range(path_ptr[p], path_ptr[p + 1]):
+                if np.random.random() > thresholds[k]:
+                    held = False
+                    break
+            if held:
+                successes += 1
+                break
+    return successes
+
+
+_monte_carlo = None
+
+
+def _monte_carlo_kernel():
+    """The Monte Carlo kernel, chosen on first use.
+
+    numba is optional and slow to import, so it is only loaded once a
+    simulation actually runs; without it the NumPy kernel is used.
+    """
+    global _monte_carlo
+    if _monte_carlo is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _monte_carlo = _mc_numpy
+        else:
+            _monte_carlo = njit(cache=True)(_mc_compiled)
+    return _monte_carlo
+
+
 class ProbabilityEngine:
     """Quantitative risk engine for INEVITABILITY v2.0.
 
@@ -54,9 +124,40 @@ class ProbabilityEngine:
         self.profile = ADVERSARY_PROFILES.get(adversary_profile, ADVERSARY_PROFILES["apt"])
         self.adversary_key = adversary_profile
         self._node_map: dict[str, InfraNode] = {n.id: n for n in self.graph.nodes}
-        self._edge_map: dict[str, list[InfraEdge]] = defaultdict(list)
-        for e in self.graph.edges:
-            self._edge_map[e.target].append(e)
+
+        # Struct-of-arrays view of the numeric fields the risk maths reads,
+        # aligned with _node_map / graph.edges
+        self._node_index: dict[str, int] = {nid: i for i, nid in enumerate(self._node_map)}
+        nodes = self._node_map.values()
+        self._is_control = np.fromiter((n.type == NodeType.CONTROL for n in nodes), dtype=bool, count=len(nodes))
+        self._bypass = np.fromiter((n.bypass_probability for n in nodes), dtype=np.float64, count=len(nodes))
+        self._state = np.fromiter((_STATE_CODES.get(n.control_state, _INACTIVE) for n in nodes), dtype=np.int8, count=len(nodes))
+        self._factors: tuple[list[float], list[float]] | None = None
+
+        # Exploit probability per hop; the first matching edge wins
+        self._edge_probs = np.fromiter(
+            (e.exploit_probability for e in self.graph.edges), dtype=np.float64, count=len(self.graph.edges),
+        )
+        self._hop_prob: dict[tuple[str, str], float] = {}
+        for e, p in zip(self.graph.edges, self._edge_probs.tolist()):
+            self._hop_prob.setdefault((e.source, e.target), p)
+
+        # Node indices of the negated parents (guards) of each variable
+        guards: dict[str, list[int]] = defaultdict(list)
+        for eq in scm.equations:
+            guards[eq.target_variable].extend(
+                self._node_index[c] for c in eq.negated_parents if c in self._node_index
+            )
+        self._guards: dict[str, list[int]] = dict(guards)
+
+        # Attack-graph structure, fixed for the engine's lifetime: successor
+        # lists (from the graph's cached edge index, in edge order), identity
+        # nodes, and attack paths per target set
+        self._adj: dict[str, tuple[str, ...]] = {
+            src: tuple(e.target for e in out) for src, out in self.graph.edges_by_source.items()
+        }
+        self._identity_ids = [n.id for n in self.graph.nodes if n.type == NodeType.IDENTITY]
+        self._paths_by_targets: dict[tuple[str, ...], list[list[str]]] = {}
 
     # ─── Path Risk ────────────────────────────────────────────────────────
 
@@ -71,24 +172,45 @@ class ProbabilityEngine:
             return 0.0
 
         risk = 1.0
-        for i in range(len(path) - 1):
-            src, tgt = path[i], path[i + 1]
+        skill = self.profile["skill_multiplier"]
+        for src, tgt in zip(path, path[1:]):
             # Find the edge between src and tgt
             edge_prob = self._get_edge_probability(src, tgt)
             # Compute residual through controls protecting this hop
             control_residual = self._compute_control_residual(tgt)
             # Apply adversary skill
-            effective_prob = min(1.0, edge_prob * self.profile["skill_multiplier"])
+            effective_prob = min(1.0, edge_prob * skill)
             risk *= effective_prob * control_residual
 
         return round(risk, 6)
 
     def _get_edge_probability(self, source: str, target: str) -> float:
         """Get the exploit probability for an edge between two nodes."""
-        for edge in self.graph.edges:
-            if edge.source == source and edge.target == target:
-                return edge.exploit_probability
-        return 0.5  # default
+        return self._hop_prob.get((source, target), 0.5)  # default 0.5
+
+    def _control_factors(self) -> tuple[list[float], list[float]]:
+        """Per-node bypass factors under the current control states.
+
+        Returns (analytic, simulated): the residual risk factor each node
+        contributes when it guards a hop. Non-controls and inactive controls
+        contribute 1.0. Partial controls are weaker (1.5x bypass); the
+        analytic factor also keeps the 1% floor on partial controls that
+        the simulation omits.
+        """
+        if self._factors is None:
+            bonus = self.profile["bypass_bonus"]
+            active = self._is_control & (self._state == _ACTIVE)
+            partial = self._is_control & (self._state == _PARTIAL)
+            active_bp = np.clip(self._bypass + bonus, 0.01, 1.0)
+            partial_bp = self._bypass * 1.5 + bonus
+            analytic = np.where(active, active_bp, np.where(partial, np.clip(partial_bp, 0.01, 1.0), 1.0))
+            simulated = np.where(active, active_bp, np.where(partial, np.minimum(partial_bp, 1.0), 1.0))
+            self._factors = (analytic.tolist(), simulated.tolist())
+        return self._factors
+
+    def _set_control_state(self, node_id: str, code: int) -> None:
+        self._state[self._node_index[node_id]] = code
+        self._factors = None
 
     def _compute_control_residual(self, target_id: str) -> float:
         """Compute residual risk after all active controls protecting a node.
@@ -96,24 +218,10 @@ class ProbabilityEngine:
         Defense-in-depth: controls stack multiplicatively.
         If WAF (70% effective) + Firewall (80% effective) protect a node:
         residual = (1-0.7) × (1-0.8) = 0.06 → 6% gets through.
+        INACTIVE controls contribute nothing (residual stays 1.0).
         """
-        residual = 1.0
-        for eq in self.scm.equations:
-            if eq.target_variable == target_id:
-                for ctrl_id in eq.negated_parents:
-                    ctrl = self._node_map.get(ctrl_id)
-                    if ctrl and ctrl.type == NodeType.CONTROL:
-                        if ctrl.control_state == ControlState.ACTIVE:
-                            bp = ctrl.bypass_probability
-                            # Apply adversary bypass bonus
-                            bp = min(1.0, max(0.01, bp + self.profile["bypass_bonus"]))
-                            residual *= bp
-                        elif ctrl.control_state == ControlState.PARTIAL:
-                            bp = ctrl.bypass_probability * 1.5  # partial = weaker
-                            bp = min(1.0, max(0.01, bp + self.profile["bypass_bonus"]))
-                            residual *= bp
-                        # INACTIVE controls contribute nothing (residual stays 1.0)
-        return residual
+        factors = self._control_factors()[0]
+        return math.prod([factors[i] for i in self._guards.get(target_id, ())], start=1.0)
 
     # ─── Goal Risk ────────────────────────────────────────────────────────
 
@@ -177,55 +285,63 @@ class ProbabilityEngine:
         }
 
     def _enumerate_attack_paths(self, goal: GoalPredicate) -> list[list[str]]:
-        """Find all attack paths from identity nodes to goal targets using BFS."""
-        identities = [n for n in self.graph.nodes if n.type == NodeType.IDENTITY]
-        targets = set(goal.target_assets)
-        all_paths = []
+        """Find all attack paths from identity nodes to goal targets using BFS.
 
-        # Build adjacency list
-        adj: dict[str, list[str]] = defaultdict(list)
-        for edge in self.graph.edges:
-            adj[edge.source].append(edge.target)
+        Paths depend only on graph structure, so they are found once per
+        target set and reused (e.g. across rank_control_impact's toggles).
+        """
+        key = tuple(goal.target_assets)
+        cached = self._paths_by_targets.get(key)
+        if cached is not None:
+            return cached
 
-        for identity in identities:
+        targets = set(goal.target_assets)
+        all_paths = []
+        reaches = {target: self.graph.get_ancestors((target,)) for target in targets}
+        for identity_id in self._identity_ids:
             for target in targets:
-                paths = self._find_paths_bfs(adj, identity.id, target, max_depth=10)
+                if identity_id not in reaches[target]:
+                    continue
+                paths = self._find_paths_bfs(self._adj, identity_id, target, max_depth=10, reaches=reaches[target])
                 all_paths.extend(paths)
 
-        return all_paths[:20]  # Cap at 20 paths for performance
+        all_paths = all_paths[:20]  # Cap at 20 paths for performance
+        self._paths_by_targets[key] = all_paths
+        return all_paths
 
     def _find_paths_bfs(
-        self, adj: dict, start: str, end: str, max_depth: int = 10
+        self, adj: dict, start: str, end: str, max_depth: int = 10,
+        reaches: set[str] | None = None,
     ) -> list[list[str]]:
-        """BFS path finding with depth limit."""
+        """BFS path finding with depth limit.
+
+        If given, reaches holds the nodes that can still get to end;
+        branches leaving it are never expanded.
+        """
         paths = []
-        queue: list[tuple[str, list[str]]] = [(start, [start])]
+        queue: deque[tuple[str, list[str]]] = deque([(start, [start])])
 
         while queue and len(paths) < 5:
-            node, path = queue.pop(0)
+            node, path = queue.popleft()
             if len(path) > max_depth:
                 continue
             if node == end:
                 paths.append(path)
                 continue
-            for neighbor in adj.get(node, []):
-                if neighbor not in path:  # avoid cycles
+            for neighbor in adj.get(node, ()):
+                if neighbor not in path and (reaches is None or neighbor in reaches):  # avoid cycles and dead ends
                     queue.append((neighbor, path + [neighbor]))
 
         return paths
 
     def _count_controls_on_paths(self, paths: list[list[str]]) -> float:
         """Average number of active controls per path hop."""
+        active = (self._state == _ACTIVE).tolist()
         total_controls = 0
         total_hops = 0
         for path in paths:
             for node_id in path:
-                for eq in self.scm.equations:
-                    if eq.target_variable == node_id:
-                        for ctrl_id in eq.negated_parents:
-                            ctrl = self._node_map.get(ctrl_id)
-                            if ctrl and ctrl.control_state == ControlState.ACTIVE:
-                                total_controls += 1
+                total_controls += sum(active[i] for i in self._guards.get(node_id, ()))
                 total_hops += 1
         return total_controls / max(total_hops, 1)
 
@@ -251,17 +367,9 @@ class ProbabilityEngine:
             else:
                 return self._empty_mc_result(goal)
 
-        successes = 0
-        risk_samples = []
-
-        for _ in range(n_simulations):
-            attack_succeeded = False
-            for path in paths:
-                if self._simulate_path(path):
-                    attack_succeeded = True
-                    break
-            if attack_succeeded:
-                successes += 1
+        # Seeded from the random module so random.seed() still reproduces runs
+        thresholds, path_ptr = self._path_rolls(paths)
+        successes = int(_monte_carlo_kernel()(thresholds, path_ptr, n_simulations, random.getrandbits(32)))
 
         probability = successes / n_simulations
         # Build distribution buckets
@@ -295,32 +403,23 @@ class ProbabilityEngine:
             "adversary_profile": self.profile["name"],
         }
 
-    def _simulate_path(self, path: list[str]) -> bool:
-        """Simulate a single attack path attempt."""
-        for i in range(len(path) - 1):
-            src, tgt = path[i], path[i + 1]
+    def _path_rolls(self, paths: list[list[str]]) -> tuple[np.ndarray, np.ndarray]:
+        """Flatten attack paths into Monte Carlo roll thresholds.
 
-            # Edge exploit roll
-            edge_prob = self._get_edge_probability(src, tgt)
-            effective_prob = min(1.0, edge_prob * self.profile["skill_multiplier"])
-            if random.random() > effective_prob:
-                return False  # Exploit failed
-
-            # Control bypass roll for each control protecting this hop
-            for eq in self.scm.equations:
-                if eq.target_variable == tgt:
-                    for ctrl_id in eq.negated_parents:
-                        ctrl = self._node_map.get(ctrl_id)
-                        if ctrl and ctrl.type == NodeType.CONTROL:
-                            if ctrl.control_state == ControlState.ACTIVE:
-                                bp = min(1.0, max(0.01, ctrl.bypass_probability + self.profile["bypass_bonus"]))
-                                if random.random() > bp:
-                                    return False  # Control blocked
-                            elif ctrl.control_state == ControlState.PARTIAL:
-                                bp = min(1.0, ctrl.bypass_probability * 1.5 + self.profile["bypass_bonus"])
-                                if random.random() > bp:
-                                    return False
-        return True  # All hops succeeded
+        Per hop: the edge exploit roll, then one bypass roll for each
+        active or partial control protecting the hop's target.
+        """
+        skill = self.profile["skill_multiplier"]
+        factors = self._control_factors()[1]
+        rolling = (self._is_control & (self._state != _INACTIVE)).tolist()
+        thresholds: list[float] = []
+        path_ptr = [0]
+        for path in paths:
+            for src, tgt in zip(path, path[1:]):
+                thresholds.append(min(1.0, self._get_edge_probability(src, tgt) * skill))
+                thresholds.extend(factors[i] for i in self._guards.get(tgt, ()) if rolling[i])
+            path_ptr.append(len(thresholds))
+        return np.array(thresholds, dtype=np.float64), np.array(path_ptr, dtype=np.int64)
 
     def _empty_mc_result(self, goal: GoalPredicate) -> dict:
         return {
@@ -354,19 +453,34 @@ class ProbabilityEngine:
             result = self.compute_goal_risk(goal, inev)
             baseline_risks[goal.id] = result["combined_risk"]
 
+        # A control's state only enters a goal's risk through the guards of
+        # the hops on that goal's paths; goals it does not guard are skipped
+        guarding = []
+        for goal, inev in zip(goals, inevitability_results):
+            paths = self._enumerate_attack_paths(goal)
+            if not paths and inev.witness_path:
+                paths = [inev.witness_path]
+            guarding.append({i for path in paths for node_id in path[1:] for i in self._guards.get(node_id, ())})
+
         for ctrl in controls:
-            # Temporarily disable this control and recompute risk
-            original_state = ctrl.control_state
-            ctrl.control_state = ControlState.INACTIVE
+            idx = self._node_index[ctrl.id]
+            original_state = self._state[idx]
 
             risk_increase = 0.0
-            for goal, inev in zip(goals, inevitability_results):
-                result = self.compute_goal_risk(goal, inev)
-                risk_without = result["combined_risk"]
-                risk_increase += risk_without - baseline_risks.get(goal.id, 0.0)
-
-            # Restore control state
-            ctrl.control_state = original_state
+            affected = [
+                (goal, inev) for (goal, inev), guards in zip(zip(goals, inevitability_results), guarding)
+                if idx in guards
+            ]
+            if original_state != _INACTIVE and affected:
+                # Temporarily disable this control and recompute risk
+                self._set_control_state(ctrl.id, _INACTIVE)
+                for goal, inev in affected:
+                    result = self.compute_goal_risk(goal, inev)
+                    risk_without = result["combined_risk"]
+                    risk_increase += risk_without - baseline_risks.get(goal.id, 0.0)
+
+                # Restore control state
+                self._set_control_state(ctrl.id, original_state)
 
             # Compute cost-effectiveness
             cost = ctrl.annual_cost or 0.0
@@ -402,16 +516,7 @@ class ProbabilityEngine:
 
         naked = []
         for asset in critical_assets:
-            has_control = False
-            for eq in self.scm.equations:
-                if eq.target_variable == asset.id and eq.negated_parents:
-                    for ctrl_id in eq.negated_parents:
-                        ctrl = self._node_map.get(ctrl_id)
-                        if ctrl and ctrl.control_state == ControlState.ACTIVE:
-                            has_control = True
-                            break
-                if has_control:
-                    break
+            has_control = any(self._state[i] == _ACTIVE for i in self._guards.get(asset.id, ()))
 
             if not has_control:
                 naked.append({
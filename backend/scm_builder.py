@@ -20,8 +20,8 @@ class SCMBuilder:
 
     def build(self) -> SCM:
         """Full SCM construction pipeline."""
-        self._validate_graph()
         self._nx_graph = self._to_networkx()
+        self._validate_graph(self._nx_graph)
         equations = self._generate_equations()
         assumptions = self._extract_assumptions()
         exogenous = self._compute_exogenous_constraints()
@@ -41,9 +41,8 @@ class SCMBuilder:
 
     # ── Graph Validation ──────────────────────────────────────────────────
 
-    def _validate_graph(self):
+    def _validate_graph(self, g: nx.DiGraph):
         """Ensure graph is a valid DAG (acyclic)."""
-        g = self._to_networkx()
         if not nx.is_directed_acyclic_graph(g):
             cycles = list(nx.simple_cycles(g))
             raise ValueError(
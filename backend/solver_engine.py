@@ -6,6 +6,7 @@ Encodes Structural Causal Models into SMT formulas and checks satisfiability.
 
 from __future__ import annotations
 import time
+from collections import OrderedDict
 from z3 import (
     Bool, BoolRef, Solver, And, Or, Not, Implies, sat, unsat, unknown,
     BoolVal, ModelRef
@@ -376,3 +377,51 @@ class CausalSolver:
     ) -> InevitabilityResult:
         """Compute inevitability under a set of interventions."""
         return self.compute_inevitability(goal, interventions)
+
+
+class CachedSolver:
+    """Memoizing wrapper around a CausalSolver.
+
+    Inevitability results are cached by goal contents and intervention set,
+    so engines sharing one instance never re-solve the same question; goals
+    that merely share an ID are kept apart. The least recently used entries
+    are evicted past ``maxsize``. Everything else is delegated to the wrapped
+    solver. Call clear_cache() after mutating the SCM.
+    """
+
+    def __init__(self, solver: CausalSolver, maxsize: int = 4096):
+        self._inner = solver
+        self._maxsize = maxsize
+        self._cache: OrderedDict[tuple, InevitabilityResult] = OrderedDict()
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    def compute_inevitability(
+        self,
+        goal: GoalPredicate,
+        interventions: dict[str, bool] | None = None,
+    ) -> InevitabilityResult:
+        key = (
+            goal.id, goal.name, tuple(goal.target_assets), tuple(goal.required_conditions),
+            goal.threshold, frozenset((interventions or {}).items()),
+        )
+        result = self._cache.get(key)
+        if result is None:
+            result = self._inner.compute_inevitability(goal, interventions)
+            self._cache[key] = result
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return result
+
+    def compute_inevitability_with_interventions(
+        self,
+        goal: GoalPredicate,
+        interventions: dict[str, bool],
+    ) -> InevitabilityResult:
+        return self.compute_inevitability(goal, interventions)
+
+    def clear_cache(self):
+        self._cache.clear()
@@ -23,7 +23,7 @@ class TheaterDetector:
     def classify_controls(
         self,
         goal: GoalPredicate,
-        mcs_control_ids: set[str] | None = None,
+        mcs_control_ids: set[str] | frozenset[str] | None = None,
     ) -> TheaterReport:
         """Classify all controls by their causal relevance to a goal.
         